@@ -16,3 +16,129 @@ DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./qa_database.db")
 # JWT settings
 ACCESS_TOKEN_EXPIRE_HOURS: int = 24
 
+
+# Voting settings
+# Votes are aggregated in memory and flushed to the database in batches
+VOTE_FLUSH_INTERVAL_SECONDS: float = float(os.getenv("VOTE_FLUSH_INTERVAL_SECONDS", "1.0"))
+
+# Group commit settings
+# When enabled, question submissions are queued and inserted in small
+# multi-row transactions instead of one commit per request
+GROUP_COMMIT_ENABLED: bool = os.getenv("GROUP_COMMIT_ENABLED", "false").lower() == "true"
+GROUP_COMMIT_MAX_BATCH: int = int(os.getenv("GROUP_COMMIT_MAX_BATCH", "64"))
+GROUP_COMMIT_MAX_DELAY_MS: float = float(os.getenv("GROUP_COMMIT_MAX_DELAY_MS", "5"))
+
+# Rate limiting settings for public write routes
+# Each client gets RATE_LIMIT_BURST requests, refilled at RATE_LIMIT_PER_SECOND.
+# Off by default: clients are keyed by IP, and a room behind one NAT shares a bucket
+RATE_LIMIT_ENABLED: bool = os.getenv("RATE_LIMIT_ENABLED", "false").lower() == "true"
+RATE_LIMIT_PER_SECOND: float = float(os.getenv("RATE_LIMIT_PER_SECOND", "5"))
+RATE_LIMIT_BURST: int = int(os.getenv("RATE_LIMIT_BURST", "50"))
+# Separate buckets for votes, which come in much faster bursts than questions
+RATE_LIMIT_VOTES_PER_SECOND: float = float(os.getenv("RATE_LIMIT_VOTES_PER_SECOND", "20"))
+RATE_LIMIT_VOTES_BURST: int = int(os.getenv("RATE_LIMIT_VOTES_BURST", "200"))
+# Use the client IP from X-Forwarded-For (only behind a trusted proxy)
+RATE_LIMIT_TRUST_FORWARDED: bool = os.getenv("RATE_LIMIT_TRUST_FORWARDED", "false").lower() == "true"
+# Optional Redis URL to share buckets across workers (requires `redis` package)
+RATE_LIMIT_REDIS_URL: str = os.getenv("RATE_LIMIT_REDIS_URL", "")
+# Maximum concurrent write requests per worker (0 disables)
+WRITE_MAX_CONCURRENCY: int = int(os.getenv("WRITE_MAX_CONCURRENCY", "64"))
+
+# Retention settings
+# Answered questions older than ARCHIVE_AFTER_DAYS are moved to archived_questions
+RETENTION_ENABLED: bool = os.getenv("RETENTION_ENABLED", "false").lower() == "true"
+ARCHIVE_AFTER_DAYS: float = float(os.getenv("ARCHIVE_AFTER_DAYS", "30"))
+ARCHIVE_BATCH_SIZE: int = int(os.getenv("ARCHIVE_BATCH_SIZE", "500"))
+RETENTION_INTERVAL_SECONDS: float = float(os.getenv("RETENTION_INTERVAL_SECONDS", "3600"))
+
+# Event stream settings
+# Number of recent broadcast events kept for resume (Last-Event-ID)
+EVENT_HISTORY_SIZE: int = int(os.getenv("EVENT_HISTORY_SIZE", "1000"))
+# Frames buffered per SSE client before it is considered too slow and dropped
+SSE_QUEUE_SIZE: int = int(os.getenv("SSE_QUEUE_SIZE", "256"))
+SSE_HEARTBEAT_SECONDS: float = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+
+# Statistics settings
+# STATS_UPDATED is broadcast at most once per interval
+STATS_BROADCAST_INTERVAL_SECONDS: float = float(os.getenv("STATS_BROADCAST_INTERVAL_SECONDS", "2.0"))
+# Re-sync counters from the database (absorbs other workers' writes, 0 disables)
+STATS_RESYNC_SECONDS: float = float(os.getenv("STATS_RESYNC_SECONDS", "300"))
+
+# Export settings
+# Rows fetched per database round trip and written per response chunk
+EXPORT_BATCH_SIZE: int = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+# Startup settings
+# Run Base.metadata.create_all on boot (disable in production, where the
+# schema already exists, to avoid racing workers and slow rollouts)
+AUTO_CREATE_TABLES: bool = os.getenv("AUTO_CREATE_TABLES", "true").lower() == "true"
+# Connections opened on startup so the first requests don't pay for connecting
+DB_WARM_CONNECTIONS: int = int(os.getenv("DB_WARM_CONNECTIONS", "2"))
+
+# Server settings (used by `python -m app.server` and gunicorn.conf.py)
+SERVER_HOST: str = os.getenv("SERVER_HOST", "0.0.0.0")
+SERVER_PORT: int = int(os.getenv("PORT", os.getenv("SERVER_PORT", "8000")))
+# Worker processes. Real-time state (WebSocket clients, event seq, snapshot, work queue,
+# stats) is per process and there is no cross-worker event bus, so keep this at 1
+# unless clients of one worker may miss events published by another.
+WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", "1"))
+# Event loop and HTTP parser; fall back to asyncio/h11 when not installed
+SERVER_LOOP: str = os.getenv("SERVER_LOOP", "uvloop")
+SERVER_HTTP: str = os.getenv("SERVER_HTTP", "httptools")
+SERVER_KEEP_ALIVE_SECONDS: int = int(os.getenv("SERVER_KEEP_ALIVE_SECONDS", "5"))
+GRACEFUL_SHUTDOWN_SECONDS: int = int(os.getenv("GRACEFUL_SHUTDOWN_SECONDS", "30"))
+WS_PING_INTERVAL_SECONDS: float = float(os.getenv("WS_PING_INTERVAL_SECONDS", "20"))
+WS_PING_TIMEOUT_SECONDS: float = float(os.getenv("WS_PING_TIMEOUT_SECONDS", "20"))
+# Largest frame a client may send; clients only send small control messages
+WS_MAX_SIZE_BYTES: int = int(os.getenv("WS_MAX_SIZE_BYTES", "65536"))
+
+# WebSocket snapshot settings
+# Questions included in the SNAPSHOT message sent on connect
+SNAPSHOT_PAGE_SIZE: int = int(os.getenv("SNAPSHOT_PAGE_SIZE", "20"))
+
+# WebSocket command settings
+# Largest command frame a client may send over /ws (closed with 1009 if exceeded)
+WS_MAX_COMMAND_BYTES: int = int(os.getenv("WS_MAX_COMMAND_BYTES", "4096"))
+
+# Profiling settings
+# When disabled the profiling middleware is not installed at all
+PROFILING_ENABLED: bool = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+# Fraction of requests to profile (admins can also send "X-Profile: 1")
+PROFILE_SAMPLE_RATE: float = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+# Requests slower than this are stored with their SQL timeline
+PROFILE_SLOW_MS: float = float(os.getenv("PROFILE_SLOW_MS", "500"))
+PROFILE_SAMPLE_INTERVAL_MS: float = float(os.getenv("PROFILE_SAMPLE_INTERVAL_MS", "2"))
+PROFILE_STORE_SIZE: int = int(os.getenv("PROFILE_STORE_SIZE", "100"))
+
+# Read replica settings
+# Optional read-only database for feed reads (unset = everything uses DATABASE_URL)
+READ_DATABASE_URL: str = os.getenv("READ_DATABASE_URL", "")
+# After a client writes, its reads go to the primary for this long (covers replica lag)
+REPLICA_LAG_WINDOW_SECONDS: float = float(os.getenv("REPLICA_LAG_WINDOW_SECONDS", "5"))
+
+# Moderator work queue settings
+# How long a claimed question stays reserved for a moderator before returning to the queue
+QUEUE_LEASE_SECONDS: float = float(os.getenv("QUEUE_LEASE_SECONDS", "120"))
+
+# Event journal settings
+# Append every broadcast event to an on-disk journal (resume across restarts, audit export)
+EVENT_JOURNAL_ENABLED: bool = os.getenv("EVENT_JOURNAL_ENABLED", "false").lower() == "true"
+# Each worker process uses its own slot-N subdirectory
+EVENT_JOURNAL_DIR: str = os.getenv("EVENT_JOURNAL_DIR", "./data/journal")
+EVENT_JOURNAL_SEGMENT_BYTES: int = int(os.getenv("EVENT_JOURNAL_SEGMENT_BYTES", str(64 * 1024 * 1024)))
+# Buffered events are written and fsynced together at this interval (the crash-loss window)
+EVENT_JOURNAL_FSYNC_MS: float = float(os.getenv("EVENT_JOURNAL_FSYNC_MS", "50"))
+# Sealed segments older than this, or beyond the size budget, are deleted (0 disables either limit)
+EVENT_JOURNAL_RETENTION_DAYS: float = float(os.getenv("EVENT_JOURNAL_RETENTION_DAYS", "30"))
+EVENT_JOURNAL_MAX_BYTES: int = int(os.getenv("EVENT_JOURNAL_MAX_BYTES", str(1024 * 1024 * 1024)))
+EVENT_JOURNAL_COMPACT_INTERVAL_SECONDS: float = float(os.getenv("EVENT_JOURNAL_COMPACT_INTERVAL_SECONDS", "3600"))
+# Resumes further behind than this get RESYNC_REQUIRED instead of a replay
+EVENT_JOURNAL_MAX_REPLAY: int = int(os.getenv("EVENT_JOURNAL_MAX_REPLAY", "10000"))
+
+# Broadcast shard settings
+# Event loops serving the read-only shard WebSocket endpoint (0 disables it)
+BROADCAST_SHARDS: int = int(os.getenv("BROADCAST_SHARDS", "0"))
+# "process" (one child process per shard, uses several cores) or "thread"
+BROADCAST_SHARD_MODE: str = os.getenv("BROADCAST_SHARD_MODE", "process")
+# All shards bind this port with SO_REUSEPORT
+BROADCAST_SHARD_PORT: int = int(os.getenv("BROADCAST_SHARD_PORT", "8001"))
@@ -1,26 +1,35 @@
 """
 Database configuration.
-Sets up SQLAlchemy engine, session, and base model.
+Sets up SQLAlchemy engines (primary and optional read replica), sessions, and base model.
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import sessionmaker, declarative_base
-from app.config import DATABASE_URL
-
-# Create SQLAlchemy engine
-# check_same_thread is only needed for SQLite, not PostgreSQL
-if DATABASE_URL.startswith("sqlite"):
-    # SQLite-specific connection args
-    engine = create_engine(
-        DATABASE_URL,
-        connect_args={"check_same_thread": False}
-    )
-else:
+from app.config import DATABASE_URL, READ_DATABASE_URL
+
+
+def _create_engine(url: str):
+    """Create an engine with the right connect args for the database type."""
+    # check_same_thread is only needed for SQLite, not PostgreSQL
+    if url.startswith("sqlite"):
+        # SQLite-specific connection args
+        return create_engine(
+            url,
+            connect_args={"check_same_thread": False}
+        )
     # PostgreSQL or other databases - no check_same_thread
-    engine = create_engine(DATABASE_URL)
+    return create_engine(url)
+
+
+# Create SQLAlchemy engine (primary, handles all writes)
+engine = _create_engine(DATABASE_URL)
 
-# Create session factory
+# Read replica engine, falls back to the primary when not configured
+read_engine = _create_engine(READ_DATABASE_URL) if READ_DATABASE_URL else engine
+
+# Create session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
 
 # Base class for all models
 Base = declarative_base()
@@ -42,3 +51,79 @@ def get_db():
     finally:
         db.close()
 
+
+
+def add_missing_columns() -> list:
+    """
+    Bring existing tables up to date with the models.
+
+    create_all only creates missing tables, so columns and indexes added
+    to a model later (e.g. questions.votes) never reach an existing
+    database. This adds them with ALTER TABLE ... ADD COLUMN and CREATE
+    INDEX. It is idempotent and only ever adds; renames and type changes
+    still need a manual migration. Foreign keys are not added to existing
+    tables (SQLite cannot), the ORM relationships work without them.
+
+    Returns the "table.column" / index names that were added.
+    """
+    added = []
+    existing_tables = set(inspect(engine).get_table_names())
+
+    with engine.begin() as conn:
+        inspector = inspect(conn)
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+
+            existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                column_type = column.type.compile(dialect=conn.dialect)
+                ddl = f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"
+                if column.server_default is not None:
+                    ddl += f" DEFAULT {column.server_default.arg}"
+                if not column.nullable and column.server_default is not None:
+                    ddl += " NOT NULL"
+                conn.execute(text(ddl))
+                added.append(f"{table.name}.{column.name}")
+
+            existing_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in existing_indexes:
+                    index.create(conn)
+                    added.append(index.name)
+
+    return added
+
+
+def warm_pool(connections: int):
+    """
+    Open connections up front so they sit in the pool, on the primary
+    and on the read replica when one is configured.
+    Fails if a database is unreachable.
+    """
+    engines = [engine] if read_engine is engine else [engine, read_engine]
+    opened = []
+    try:
+        for bind in engines:
+            for _ in range(connections):
+                conn = bind.connect()
+                opened.append(conn)
+                conn.execute(text("SELECT 1"))
+    finally:
+        for conn in opened:
+            conn.close()  # Returns the connection to the pool
+
+
+def ping(bind=engine) -> bool:
+    """
+    Check that a database answers a trivial query.
+    Returns True if reachable, False otherwise.
+    """
+    try:
+        with bind.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        return True
+    except Exception:
+        return False
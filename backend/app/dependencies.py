@@ -3,10 +3,15 @@ Shared dependencies.
 Reusable dependencies for FastAPI routes.
 """
 
-from fastapi import Header, HTTPException, status
+import math
+from fastapi import Header, HTTPException, Request, Response, status
 from typing import Optional
 
+from app.config import GROUP_COMMIT_ENABLED, RATE_LIMIT_ENABLED, RATE_LIMIT_TRUST_FORWARDED
+from app.database import SessionLocal, ReadSessionLocal
 from app.services.auth import verify_access_token
+from app.services.rate_limit import rate_limiter, vote_rate_limiter, write_admission
+from app.services.read_routing import read_router, PRIMARY_COOKIE
 
 
 def get_current_user(authorization: str = Header(default=None)) -> Optional[dict]:
@@ -45,3 +50,138 @@ def get_current_user(authorization: str = Header(default=None)) -> Optional[dict
     
     return payload
 
+
+
+def get_client_key(request: Request) -> str:
+    """
+    Identify the client for rate limiting.
+    Uses the first X-Forwarded-For hop only when behind a trusted proxy.
+    """
+    if RATE_LIMIT_TRUST_FORWARDED:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    
+    return request.client.host if request.client else "unknown"
+
+
+async def _check_rate_limit(request: Request, limiter):
+    """Take a token from the client's bucket in limiter, 429 with Retry-After when exhausted."""
+    if not RATE_LIMIT_ENABLED:
+        return
+    
+    retry_after = await limiter.hit(get_client_key(request))
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests, slow down",
+            headers={"Retry-After": str(math.ceil(retry_after))}
+        )
+
+
+def _admit_write():
+    """Reserve a write slot in this worker, 503 with Retry-After when overloaded."""
+    if not write_admission.try_acquire():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy, please retry",
+            headers={"Retry-After": "1"}
+        )
+
+
+async def limit_public_writes(request: Request):
+    """
+    Dependency that protects unauthenticated write routes.
+    
+    - Per-client token bucket: 429 with Retry-After when exhausted
+    - Per-worker concurrency cap: 503 with Retry-After when overloaded
+    
+    Usage:
+        @router.post("/", dependencies=[Depends(limit_public_writes)])
+    """
+    await _check_rate_limit(request, rate_limiter)
+    _admit_write()
+    try:
+        yield
+    finally:
+        write_admission.release()
+
+
+async def limit_question_writes(request: Request):
+    """
+    limit_public_writes for POST /questions/.
+    
+    With GROUP_COMMIT_ENABLED, submissions only wait on the group commit
+    writer, whose batches already bound the database work, so they skip
+    the concurrency cap: a burst of questions is absorbed instead of
+    rejected with 503.
+    
+    Usage:
+        @router.post("/", dependencies=[Depends(limit_question_writes)])
+    """
+    await _check_rate_limit(request, rate_limiter)
+    if GROUP_COMMIT_ENABLED:
+        yield
+        return
+    
+    _admit_write()
+    try:
+        yield
+    finally:
+        write_admission.release()
+
+
+async def limit_votes(request: Request):
+    """
+    Same as limit_public_writes, with the separate (larger) vote buckets,
+    so voting never uses up a client's budget for posting questions.
+    
+    Usage:
+        @router.post("/{question_id}/vote", dependencies=[Depends(limit_votes)])
+    """
+    await _check_rate_limit(request, vote_rate_limiter)
+    _admit_write()
+    try:
+        yield
+    finally:
+        write_admission.release()
+
+
+def get_read_db(request: Request):
+    """
+    Dependency that provides a session for read-only routes.
+    Uses the read replica (if configured) unless this client wrote
+    recently, in which case it reads from the primary to see its own writes.
+    
+    Usage in routes:
+        @router.get("/")
+        def get_items(db: Session = Depends(get_read_db)):
+            ...
+    """
+    use_primary = read_router.use_primary(get_client_key(request), request.cookies.get(PRIMARY_COOKIE))
+    db = SessionLocal() if use_primary else ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def track_write(request: Request, response: Response):
+    """
+    Dependency for write routes.
+    Sends the client's next reads to the primary for the replica lag window.
+    
+    Usage:
+        @router.post("/", dependencies=[Depends(track_write)])
+    """
+    if not read_router.enabled:
+        return
+    
+    until = read_router.mark_write(get_client_key(request))
+    response.set_cookie(
+        PRIMARY_COOKIE,
+        str(until),
+        max_age=math.ceil(read_router.lag_window),
+        httponly=True,
+        samesite="lax"
+    )
@@ -3,11 +3,41 @@ Q&A Dashboard API
 Main application entry point.
 """
 
+import time
+
+# Measure cold start from the moment the app module is imported
+BOOT_STARTED = time.perf_counter()
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.database import engine, Base
-from app.routers import auth_router, questions_router, websocket_router
+from app.config import (
+    GROUP_COMMIT_ENABLED,
+    RETENTION_ENABLED,
+    AUTO_CREATE_TABLES,
+    DB_WARM_CONNECTIONS,
+    PROFILING_ENABLED,
+    EVENT_JOURNAL_ENABLED,
+    BROADCAST_SHARDS,
+)
+from app.database import engine, Base, warm_pool, add_missing_columns
+from app.routers import (
+    auth_router,
+    questions_router,
+    websocket_router,
+    events_router,
+    health_router,
+    admin_router,
+)
+from app.services.votes import vote_aggregator
+from app.services.group_commit import question_writer
+from app.services.retention import retention_job
+from app.services.stats import question_stats
+from app.services.snapshot import feed_snapshot
+from app.services.work_queue import moderator_queue
+from app.services.websocket import manager
+from app.services.journal import event_journal
+from app.services.broadcast_shards import broadcast_shards
 
 # Create FastAPI application
 app = FastAPI(
@@ -16,6 +46,10 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Readiness state, reported by /health/ready
+app.state.ready = False
+app.state.startup_seconds = None
+
 # Configure CORS
 # Allows all origins (for development and flexibility)
 app.add_middleware(
@@ -26,19 +60,90 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Opt-in request profiling (not installed at all when disabled)
+if PROFILING_ENABLED:
+    from app.services.profiling import ProfilingMiddleware, install_sql_listeners
+    
+    install_sql_listeners()
+    app.add_middleware(ProfilingMiddleware)
+
 
 @app.on_event("startup")
 def on_startup():
     """
     Runs when the application starts.
-    Creates all database tables.
+    Creates all database tables and adds new columns (unless AUTO_CREATE_TABLES is off),
+    warms the connection pool and loads in-memory state.
     """
     # Import models to ensure they are registered with Base
-    from app.models import User, Question  # noqa: F401
+    from app.models import User, Question, ArchivedQuestion  # noqa: F401
     
     # Create all tables
-    Base.metadata.create_all(bind=engine)
-    print("✓ Database tables created (users, questions)")
+    if AUTO_CREATE_TABLES:
+        Base.metadata.create_all(bind=engine)
+        print("✓ Database tables created (users, questions, archived_questions)")
+        
+        # Columns added to models after a table was first created
+        added = add_missing_columns()
+        if added:
+            print(f"✓ Database schema updated: {', '.join(added)}")
+    
+    # Open pooled connections (fails fast if the database is unreachable)
+    warm_pool(DB_WARM_CONNECTIONS)
+    
+    # Load dashboard statistics counters and the moderator work queue
+    question_stats.rebuild()
+    moderator_queue.rebuild()
+    
+    # Journal broadcasts, continuing the sequence numbers of the last run
+    if EVENT_JOURNAL_ENABLED:
+        last_seq = event_journal.open()
+        manager.attach_journal(event_journal)
+        print(f"✓ Event journal opened at {event_journal.path} (last seq {last_seq})")
+
+
+@app.on_event("startup")
+async def start_background_tasks():
+    """
+    Starts background tasks that live for the lifetime of the app.
+    """
+    vote_aggregator.start()
+    question_stats.start()
+    if GROUP_COMMIT_ENABLED:
+        question_writer.start()
+    if RETENTION_ENABLED:
+        retention_job.start()
+    if EVENT_JOURNAL_ENABLED:
+        event_journal.start()
+    if BROADCAST_SHARDS:
+        await broadcast_shards.start()
+        manager.attach_shards(broadcast_shards)
+        print(f"✓ {BROADCAST_SHARDS} broadcast shards on port {broadcast_shards.port}")
+    
+    # Build the WebSocket feed snapshot before the first client connects
+    await feed_snapshot.get()
+    
+    # Everything is loaded, start reporting ready
+    app.state.startup_seconds = round(time.perf_counter() - BOOT_STARTED, 3)
+    app.state.ready = True
+    print(f"✓ Ready in {app.state.startup_seconds}s")
+
+
+@app.on_event("shutdown")
+async def stop_background_tasks():
+    """
+    Stops background tasks and flushes any buffered state.
+    """
+    app.state.ready = False
+    await question_stats.stop()
+    await retention_job.stop()
+    await question_writer.stop()
+    await vote_aggregator.stop()
+    if BROADCAST_SHARDS:
+        await broadcast_shards.stop()
+    if EVENT_JOURNAL_ENABLED:
+        # Last, so the events broadcast by the final flushes above are written
+        await event_journal.stop()
 
 
 @app.get("/")
@@ -46,6 +151,7 @@ def root():
     """
     Health check endpoint.
     Returns API status.
+    For orchestrator probes use /health/live and /health/ready.
     """
     return {
         "status": "ok",
@@ -57,4 +163,7 @@ def root():
 app.include_router(auth_router)
 app.include_router(questions_router)
 app.include_router(websocket_router)
+app.include_router(events_router)
+app.include_router(health_router)
+app.include_router(admin_router)
 
@@ -5,6 +5,7 @@ Export all models for easy importing.
 
 from app.models.user import User
 from app.models.question import Question
+from app.models.archived_question import ArchivedQuestion
 
-# This allows: from app.models import User, Question
-__all__ = ["User", "Question"]
+# This allows: from app.models import User, Question, ArchivedQuestion
+__all__ = ["User", "Question", "ArchivedQuestion"]
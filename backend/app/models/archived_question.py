@@ -0,0 +1,39 @@
+"""
+Archived question model.
+Holds answered questions moved out of the live questions table.
+"""
+
+from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class ArchivedQuestion(Base):
+    """
+    Archived questions table.
+    Same columns as questions, filled by the retention job so the
+    live feed only has to sort recent and open questions.
+    
+    Columns:
+        question_id: Primary key (kept from the questions table)
+        message: The question text
+        status: Always "Answered" when archived by retention
+        timestamp: When the question was posted
+        answer: The answer text
+        answered_by: User who marked it answered
+        answered_at: When the question was marked answered
+        votes: Number of upvotes received
+        archived_at: When the question was moved to the archive
+    """
+    __tablename__ = "archived_questions"
+    
+    question_id = Column(Integer, primary_key=True, autoincrement=False)
+    message = Column(Text, nullable=False)
+    status = Column(String(20), nullable=False)
+    timestamp = Column(DateTime)
+    answer = Column(Text, nullable=True)
+    answered_by = Column(Integer, nullable=True)
+    answered_at = Column(DateTime, nullable=True, index=True)
+    votes = Column(Integer, nullable=False, default=0, server_default="0")
+    archived_at = Column(DateTime, server_default=func.now())
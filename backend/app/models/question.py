@@ -3,7 +3,7 @@ Question model.
 Represents questions posted by users (guests or admins).
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -23,8 +23,15 @@ class Question(Base):
         answer: The answer text (nullable until answered)
         answered_by: Foreign key to user who marked it answered
         answered_at: When the question was marked answered
+        votes: Number of upvotes received
+        claimed_by: Moderator currently working the question (work queue lease)
+        claim_expires_at: When that lease runs out
     """
     __tablename__ = "questions"
+    __table_args__ = (
+        # Lets the retention job find old answered questions without a full scan
+        Index("ix_questions_status_answered_at", "status", "answered_at"),
+    )
     
     question_id = Column(Integer, primary_key=True, autoincrement=True)
     message = Column(Text, nullable=False)
@@ -33,7 +40,10 @@ class Question(Base):
     answer = Column(Text, nullable=True)
     answered_by = Column(Integer, ForeignKey("users.user_id"), nullable=True)
     answered_at = Column(DateTime, nullable=True)
+    votes = Column(Integer, nullable=False, default=0, server_default="0")
+    claimed_by = Column(Integer, ForeignKey("users.user_id"), nullable=True)
+    claim_expires_at = Column(DateTime, nullable=True)
     
     # Relationship to get the user who answered
-    answered_by_user = relationship("User", backref="answered_questions")
+    answered_by_user = relationship("User", foreign_keys=[answered_by], backref="answered_questions")
 
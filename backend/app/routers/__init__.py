@@ -6,5 +6,15 @@ Export all routers for easy importing.
 from app.routers.auth import router as auth_router
 from app.routers.questions import router as questions_router
 from app.routers.websocket import router as websocket_router
+from app.routers.events import router as events_router
+from app.routers.health import router as health_router
+from app.routers.admin import router as admin_router
 
-__all__ = ["auth_router", "questions_router", "websocket_router"]
+__all__ = [
+    "auth_router",
+    "questions_router",
+    "websocket_router",
+    "events_router",
+    "health_router",
+    "admin_router",
+]
@@ -0,0 +1,91 @@
+"""
+Admin router.
+Handles diagnostics endpoints for logged-in admins.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
+from typing import Iterator, Optional
+
+from app.config import EVENT_JOURNAL_ENABLED, EXPORT_BATCH_SIZE
+from app.dependencies import get_current_user
+from app.services.journal import event_journal
+from app.services.profiling import profile_store
+
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"]
+)
+
+
+@router.get("/profiles")
+def list_profiles(current_user: dict = Depends(get_current_user)):  # Admin only!
+    """
+    List captured request profiles (Admin only).
+    
+    - Newest first, without SQL statements and stack samples
+    - Requires PROFILING_ENABLED, otherwise always empty
+    """
+    return {"profiles": profile_store.list()}
+
+
+@router.get("/profiles/{profile_id}")
+def get_profile(profile_id: int, current_user: dict = Depends(get_current_user)):  # Admin only!
+    """
+    Get one request profile (Admin only).
+    
+    - sql: Statement timeline (offset from request start, duration)
+    - stacks: Most frequent sampled stacks (root;...;leaf), null for
+      requests captured only because they were slow
+    """
+    profile = profile_store.get(profile_id)
+    
+    if not profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
+        )
+    
+    return profile
+
+
+def _ndjson_chunks(payloads: Iterator[bytes]) -> Iterator[bytes]:
+    """Join journal payloads into newline-delimited chunks of EXPORT_BATCH_SIZE events."""
+    chunk = []
+    for payload in payloads:
+        chunk.append(payload)
+        if len(chunk) >= EXPORT_BATCH_SIZE:
+            yield b"\n".join(chunk) + b"\n"
+            chunk = []
+    if chunk:
+        yield b"\n".join(chunk) + b"\n"
+
+
+@router.get("/events")
+async def export_events(
+    after_seq: int = Query(default=0, ge=0, description="Only events with a greater seq"),
+    until_seq: Optional[int] = Query(default=None, ge=0, description="Only events up to this seq"),
+    current_user: dict = Depends(get_current_user)  # Admin only!
+):
+    """
+    Export journaled broadcast events as NDJSON (Admin only).
+    
+    - One event per line, exactly as broadcast (with its seq)
+    - Streams straight from the memory-mapped journal segments
+    - Requires EVENT_JOURNAL_ENABLED; covers this worker's journal only
+    """
+    if not EVENT_JOURNAL_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Event journal is not enabled"
+        )
+    
+    # Include events still waiting for the next group fsync
+    await event_journal.flush()
+    
+    return StreamingResponse(
+        _ndjson_chunks(event_journal.read_raw(after_seq, until_seq)),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": "attachment; filename=events.ndjson"}
+    )
@@ -0,0 +1,96 @@
+"""
+Events router.
+Server-Sent Events stream as a read-only alternative to the WebSocket.
+"""
+
+import asyncio
+import json
+from fastapi import APIRouter, Header, Query, Request
+from fastapi.responses import StreamingResponse
+from typing import Optional
+
+from app.config import SSE_HEARTBEAT_SECONDS
+from app.services.websocket import manager, parse_event_id
+
+
+router = APIRouter(tags=["Events"])
+
+
+@router.get("/events")
+async def event_stream(
+    request: Request,
+    last_event_id: Optional[str] = Query(default=None, description="Resume after this event id"),
+    last_event_id_header: Optional[str] = Header(default=None, alias="Last-Event-ID"),
+):
+    """
+    Server-Sent Events endpoint for real-time updates.
+    
+    Clients connect to: http://localhost:8000/events
+    
+    Sends the same events as /ws (NEW_QUESTION, QUESTION_ANSWERED,
+    QUESTION_UPDATED, QUESTION_DELETED, ...). Each frame's id is
+    "<epoch>-<seq>"; browsers send it back as Last-Event-ID on reconnect
+    and missed events are replayed (from the event journal if they have
+    left the in-memory history). If they are gone, or the id comes from
+    another server process, a RESYNC_REQUIRED event tells the client to
+    reload the feed.
+    
+    Example frame:
+        id: 3f9a1c2e-42
+        event: NEW_QUESTION
+        data: {"type": "NEW_QUESTION", "data": {...}, "seq": 42, "epoch": "3f9a1c2e"}
+    """
+    # Header (sent by EventSource) wins over the query parameter
+    resume = (
+        (parse_event_id(last_event_id_header) if last_event_id_header else None)
+        or (parse_event_id(last_event_id) if last_event_id else None)
+    )
+    resume_from = resume[1] if resume else None
+    
+    # Subscribe before reading history so no event falls in between
+    queue = manager.subscribe_sse()
+    backlog = await manager.replay_since(resume_from, resume[0]) if resume else []
+    
+    async def stream():
+        try:
+            # Tell EventSource how long to wait before reconnecting
+            yield "retry: 3000\n\n"
+            
+            if backlog is None:
+                resync = json.dumps({"seq": manager.sequence, "epoch": manager.epoch})
+                yield f"event: RESYNC_REQUIRED\ndata: {resync}\n\n"
+                last_sent = manager.sequence
+            else:
+                last_sent = resume_from or 0
+                for message in backlog:
+                    yield manager.encode_sse(message)
+                    last_sent = message["seq"]
+            
+            while True:
+                try:
+                    frame = await asyncio.wait_for(queue.get(), SSE_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    # Comment line keeps proxies from closing an idle stream
+                    yield ": keep-alive\n\n"
+                    continue
+                
+                if frame is None:
+                    # Dropped as a slow consumer
+                    break
+                
+                # Skip frames already replayed from the history
+                if parse_event_id(frame[4:frame.index("\n")])[1] <= last_sent:
+                    continue
+                
+                yield frame
+        finally:
+            manager.unsubscribe_sse(queue)
+    
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # Disable nginx response buffering
+        }
+    )
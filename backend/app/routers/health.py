@@ -0,0 +1,53 @@
+"""
+Health router.
+Liveness and readiness probes for load balancers and orchestrators.
+"""
+
+from fastapi import APIRouter, Request, Response, status
+
+from app.database import engine, read_engine, ping
+
+
+router = APIRouter(
+    prefix="/health",
+    tags=["Health"]
+)
+
+
+@router.get("/live")
+def liveness():
+    """
+    Liveness probe.
+    
+    Returns ok as long as the process serves requests.
+    Does not touch the database, so a database outage does not
+    get healthy workers restarted.
+    """
+    return {"status": "ok"}
+
+
+@router.get("/ready")
+def readiness(request: Request, response: Response):
+    """
+    Readiness probe.
+    
+    Returns 200 only after startup finished (pool warmed, state loaded)
+    and while the database (and read replica, if configured) answers. Returns 503 otherwise, so traffic
+    is not routed to a worker that cannot serve it.
+    """
+    if not request.app.state.ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "starting"}
+    
+    if not ping(engine):
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "database unavailable"}
+    
+    if read_engine is not engine and not ping(read_engine):
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "read replica unavailable"}
+    
+    return {
+        "status": "ready",
+        "startup_seconds": request.app.state.startup_seconds
+    }
@@ -4,22 +4,34 @@ Handles all question-related endpoints.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import case
 from typing import List, Optional
 from datetime import datetime
 
+from app.config import GROUP_COMMIT_ENABLED
 from app.database import get_db
 from app.models.question import Question
+from app.models.archived_question import ArchivedQuestion
 from app.schemas.question import (
     QuestionCreate,
     QuestionAnswer,
     QuestionStatusUpdate,
     QuestionResponse,
     QuestionPaginatedResponse,
+    ArchivedQuestionPaginatedResponse,
+    QuestionStatsResponse,
+    VoteResponse,
+    QueueClaimResponse,
 )
-from app.dependencies import get_current_user
+from app.dependencies import get_current_user, limit_public_writes, limit_question_writes, limit_votes, get_read_db, track_write
 from app.services.websocket import manager
+from app.services.votes import vote_aggregator
+from app.services.group_commit import question_writer
+from app.services.stats import question_stats
+from app.services.feed import get_feed_page
+from app.services.work_queue import moderator_queue
+from app.services.export import iter_question_rows, stream_ndjson, stream_csv
 
 
 router = APIRouter(
@@ -32,47 +44,56 @@ router = APIRouter(
 def get_questions(
     limit: int = Query(default=20, ge=1, le=100, description="Number of questions per page"),
     cursor: Optional[int] = Query(default=None, description="Last question_id from previous page"),
-    db: Session = Depends(get_db)
+    sort: str = Query(default="status", pattern="^(status|votes)$", description="Sort order: status or votes"),
+    db: Session = Depends(get_read_db)
 ):
     """
     Get paginated questions with cursor-based pagination.
     
     - **limit**: Number of questions per page (1-100, default: 20)
     - **cursor**: Last question_id from previous page (for next page)
+    - **sort**: "status" (default) or "votes"
     
-    Returns questions sorted by:
+    With sort=status, questions are sorted by:
     1. Escalated first
     2. Then Pending
     3. Then Answered
     Within each group, sorted by timestamp (newest first)
+    
+    With sort=votes, questions are sorted by votes (highest first),
+    then by timestamp (newest first)
     """
-    # Custom sort order: Escalated > Pending > Answered
-    status_order = case(
-        (Question.status == "Escalated", 1),
-        (Question.status == "Pending", 2),
-        (Question.status == "Answered", 3),
-        else_=4
-    )
+    return get_feed_page(db, limit, cursor, sort)
+
+
+@router.get("/archive", response_model=ArchivedQuestionPaginatedResponse)
+def get_archived_questions(
+    limit: int = Query(default=20, ge=1, le=100, description="Number of questions per page"),
+    cursor: Optional[int] = Query(default=None, description="Last question_id from previous page"),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Get archived questions with cursor-based pagination.
     
-    # Build base query
-    query = db.query(Question)
+    - **limit**: Number of questions per page (1-100, default: 20)
+    - **cursor**: Last question_id from previous page (for next page)
+    
+    Returns questions moved out of the live feed by the retention job,
+    sorted by question_id (newest first)
+    """
+    query = db.query(ArchivedQuestion)
     
-    # Apply cursor filter if provided
     if cursor:
-        query = query.filter(Question.question_id < cursor)
+        query = query.filter(ArchivedQuestion.question_id < cursor)
     
-    # Apply sorting and fetch limit + 1 to check if there are more
     questions = query.order_by(
-        status_order,
-        Question.timestamp.desc()
+        ArchivedQuestion.question_id.desc()
     ).limit(limit + 1).all()
     
-    # Check if there are more questions
     has_more = len(questions) > limit
     if has_more:
-        questions = questions[:limit]  # Remove the extra one
+        questions = questions[:limit]
     
-    # Get next cursor (last question_id if there are more)
     next_cursor = questions[-1].question_id if questions and has_more else None
     
     return {
@@ -82,7 +103,105 @@ def get_questions(
     }
 
 
-@router.post("/", response_model=QuestionResponse, status_code=status.HTTP_201_CREATED)
+@router.get("/stats", response_model=QuestionStatsResponse)
+def get_question_stats():
+    """
+    Get dashboard statistics.
+    
+    - Counts per status, total and unanswered backlog
+    - Mean time-to-answer in seconds (timestamp to answered_at)
+    
+    Served from incrementally maintained counters, no table scan.
+    Includes archived questions.
+    """
+    return question_stats.snapshot()
+
+
+@router.get("/export")
+def export_questions(
+    format: str = Query(default="ndjson", pattern="^(ndjson|csv)$", description="Output format: ndjson or csv"),
+    status_filter: Optional[str] = Query(default=None, alias="status", description="Only questions with this status"),
+    since: Optional[datetime] = Query(default=None, description="Only questions posted at or after this time"),
+    until: Optional[datetime] = Query(default=None, description="Only questions posted before this time"),
+    include_archived: bool = Query(default=False, description="Also export archived questions"),
+    current_user: dict = Depends(get_current_user)  # Admin only!
+):
+    """
+    Export questions as a stream (Admin only).
+    
+    - **format**: "ndjson" (default) or "csv"
+    - **status**, **since**, **until**: optional filters
+    - **include_archived**: append archived questions after live ones
+    
+    Rows are read in batches through a server-side cursor and written
+    as they arrive, so memory stays constant for any number of rows.
+    """
+    rows = iter_question_rows(status_filter, since, until, include_archived)
+    
+    if format == "csv":
+        return StreamingResponse(
+            stream_csv(rows),
+            media_type="text/csv",
+            headers={"Content-Disposition": "attachment; filename=questions.csv"}
+        )
+    
+    return StreamingResponse(
+        stream_ndjson(rows),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": "attachment; filename=questions.ndjson"}
+    )
+
+
+@router.post("/queue/claim", response_model=QueueClaimResponse)
+async def claim_next_question(
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)  # Admin only!
+):
+    """
+    Claim the next question to handle (Admin only).
+    
+    - Escalated first, then most votes, then oldest
+    - The question is leased to the caller for QUEUE_LEASE_SECONDS so other
+      moderators get the next one; answering or releasing ends the lease
+    - Calling again while holding a lease claims another question
+    """
+    claim = await moderator_queue.claim(current_user["user_id"])
+    if claim is None:
+        return {"question": None, "lease_expires_at": None, "queue_length": len(moderator_queue)}
+    
+    question_id, lease_expires_at = claim
+    question = db.query(Question).filter(Question.question_id == question_id).first()
+    
+    return {
+        "question": question,
+        "lease_expires_at": lease_expires_at,
+        "queue_length": len(moderator_queue)
+    }
+
+
+@router.post("/{question_id}/release", status_code=status.HTTP_204_NO_CONTENT)
+async def release_question(
+    question_id: int,
+    current_user: dict = Depends(get_current_user)  # Admin only!
+):
+    """
+    Return a claimed question to the work queue (Admin only).
+    
+    - Only the moderator holding the lease can release it
+    """
+    if not await moderator_queue.release(question_id, current_user["user_id"]):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Question is not claimed by you"
+        )
+
+
+@router.post(
+    "/",
+    response_model=QuestionResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(limit_question_writes), Depends(track_write)]
+)
 async def create_question(
     question_data: QuestionCreate,
     db: Session = Depends(get_db)
@@ -90,8 +209,9 @@ async def create_question(
     """
     Submit a new question.
     
-    - Anyone can submit (no auth required)
+    - Anyone can submit (no auth required, rate limited per client)
     - Broadcasts new question to all WebSocket clients
+    - With GROUP_COMMIT_ENABLED, the insert is batched with concurrent submissions
     """
     # Validate message is not empty
     if not question_data.message.strip():
@@ -100,6 +220,19 @@ async def create_question(
             detail="Question message cannot be empty"
         )
     
+    # Group commit: the writer inserts and broadcasts the whole batch
+    if GROUP_COMMIT_ENABLED:
+        new_question = await question_writer.submit(question_data.message.strip())
+        question_stats.question_created()
+        # The writer returns the broadcast payload (timestamp as an ISO string)
+        moderator_queue.upsert(
+            new_question["question_id"],
+            new_question["status"],
+            new_question["votes"],
+            datetime.fromisoformat(new_question["timestamp"])
+        )
+        return new_question
+    
     # Create question
     new_question = Question(
         message=question_data.message.strip(),
@@ -109,6 +242,10 @@ async def create_question(
     db.add(new_question)
     db.commit()
     db.refresh(new_question)
+    question_stats.question_created()
+    moderator_queue.upsert(
+        new_question.question_id, new_question.status, new_question.votes, new_question.timestamp
+    )
     
     # Broadcast to all WebSocket clients
     await manager.broadcast({
@@ -120,14 +257,19 @@ async def create_question(
             "timestamp": new_question.timestamp.isoformat(),
             "answer": new_question.answer,
             "answered_by": new_question.answered_by,
-            "answered_at": None
+            "answered_at": None,
+            "votes": new_question.votes
         }
     })
     
     return new_question
 
 
-@router.post("/{question_id}/answer", response_model=QuestionResponse)
+@router.post(
+    "/{question_id}/answer",
+    response_model=QuestionResponse,
+    dependencies=[Depends(limit_public_writes), Depends(track_write)]
+)
 async def answer_question(
     question_id: int,
     answer_data: QuestionAnswer,
@@ -136,7 +278,7 @@ async def answer_question(
     """
     Answer a question.
     
-    - Anyone can answer (no auth required)
+    - Anyone can answer (no auth required, rate limited per client)
     - Broadcasts update to all WebSocket clients
     """
     # Find question
@@ -172,7 +314,29 @@ async def answer_question(
     return question
 
 
-@router.patch("/{question_id}/status", response_model=QuestionResponse)
+@router.post(
+    "/{question_id}/vote",
+    response_model=VoteResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(limit_votes), Depends(track_write)]
+)
+async def vote_question(question_id: int):
+    """
+    Upvote a question.
+    
+    - Anyone can vote (no auth required, rate limited per client)
+    - Votes are aggregated in memory and flushed to the database in batches
+    - Updated totals are broadcast as a throttled VOTES_UPDATED event
+    """
+    queued = vote_aggregator.add_vote(question_id)
+    
+    return {
+        "question_id": question_id,
+        "queued": queued
+    }
+
+
+@router.patch("/{question_id}/status", response_model=QuestionResponse, dependencies=[Depends(track_write)])
 async def update_status(
     question_id: int,
     status_data: QuestionStatusUpdate,
@@ -203,6 +367,10 @@ async def update_status(
             detail="Question not found"
         )
     
+    # Remember previous values for the stats counters
+    old_status = question.status
+    old_answered_at = question.answered_at
+    
     # Update status
     question.status = status_data.status
     
@@ -213,6 +381,10 @@ async def update_status(
     
     db.commit()
     db.refresh(question)
+    question_stats.question_changed(
+        old_status, old_answered_at, question.status, question.answered_at, question.timestamp
+    )
+    moderator_queue.upsert(question.question_id, question.status, question.votes, question.timestamp)
     
     # Broadcast to all WebSocket clients
     await manager.broadcast({
@@ -228,7 +400,7 @@ async def update_status(
     return question
 
 
-@router.delete("/{question_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete("/{question_id}", status_code=status.HTTP_204_NO_CONTENT, dependencies=[Depends(track_write)])
 async def delete_question(
     question_id: int,
     db: Session = Depends(get_db),
@@ -250,12 +422,18 @@ async def delete_question(
             detail="Question not found"
         )
     
-    # Step 3: Store question_id for WebSocket broadcast
+    # Step 3: Store question_id for WebSocket broadcast (and fields for stats)
     deleted_question_id = question.question_id
+    deleted_status = question.status
+    deleted_timestamp = question.timestamp
+    deleted_answered_at = question.answered_at
     
     # Step 4: Delete from database
     db.delete(question)
     db.commit()
+    vote_aggregator.discard(deleted_question_id)
+    moderator_queue.remove(deleted_question_id)
+    question_stats.question_deleted(deleted_status, deleted_timestamp, deleted_answered_at)
     
     # Step 5: Broadcast deletion via WebSocket
     await manager.broadcast({
@@ -4,24 +4,42 @@ Handles real-time WebSocket connections for live updates.
 """
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from pydantic import ValidationError
+from typing import Optional, Tuple
 
-from app.services.websocket import manager
+from app.config import WS_MAX_COMMAND_BYTES
+from app.schemas.websocket import WebSocketCommand
+from app.services.encoding import JSON, SUBPROTOCOLS, available_encodings, decode
+from app.services.websocket import manager, EVENT_TYPES
+from app.services.snapshot import feed_snapshot
 
 
 router = APIRouter(tags=["WebSocket"])
 
 
 @router.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket):
+async def websocket_endpoint(websocket: WebSocket, snapshot: bool = False, encoding: str = JSON):
     """
     WebSocket endpoint for real-time updates.
     
     Clients connect to: ws://localhost:8000/ws
+    (ws://localhost:8000/ws?snapshot=true to start with a snapshot of the feed)
+    
+    Encoding: offer the "qa.msgpack" subprotocol (or ?encoding=msgpack)
+    to get MessagePack binary frames instead of JSON text, both ways.
     
     Messages sent to clients:
+    - SNAPSHOT: With ?snapshot=true, right after connecting, the first
+      page of the feed (same shape as GET /questions/) and the event seq
+      it reflects. Any later events are sent after it, so no separate GET
+      is needed. Off by default: the frontend loads the feed with GET.
     - NEW_QUESTION: When a new question is posted
     - QUESTION_ANSWERED: When a question is answered
     - QUESTION_UPDATED: When question status changes
+    - QUESTION_DELETED: When a question is deleted
+    - QUESTIONS_ARCHIVED: Question ids moved to the archive by retention
+      ({"question_ids": [...]}, one event per batch)
+    - VOTES_UPDATED: Batched vote totals
     
     Example message:
     {
@@ -31,21 +49,157 @@ async def websocket_endpoint(websocket: WebSocket):
             "message": "What is...?",
             "status": "Pending",
             ...
-        }
+        },
+        "seq": 1
     }
+    
+    Commands clients may send (max WS_MAX_COMMAND_BYTES per frame):
+    - {"type": "subscribe", "events": [...]}: Only receive these event types
+    - {"type": "unsubscribe", "events": [...]}: Stop receiving these event types
+    - {"type": "ack", "seq": n}: Events up to n were processed
+    - {"type": "ping"}: Answered with PONG and the current seq
+    - {"type": "resume", "seq": n, "epoch": e}: Replay buffered or journaled events after n,
+      or RESYNC_REQUIRED if they are gone (reload the feed)
+    
+    Invalid commands are answered with an ERROR message. Replayed and
+    live events may interleave, so clients skip seq they already applied.
     """
-    # Accept the connection and add to manager
-    await manager.connect(websocket)
+    # Pick the encoding from the offered subprotocols, then the query parameter
+    websocket.state.encoding, subprotocol = negotiate_encoding(websocket, encoding)
+    websocket.state.events = None  # None = all events
+    websocket.state.acked_seq = 0
+    
+    await websocket.accept(subprotocol=subprotocol)
+    
+    if snapshot:
+        await send_snapshot(websocket)
+    else:
+        manager.register(websocket)
     
     try:
-        # Keep connection alive
         while True:
-            # Wait for any message from client (keeps connection open)
-            # We don't process incoming messages, just keep alive
-            data = await websocket.receive_text()
-            # Could handle client messages here if needed in the future
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                break
+            
+            data = frame.get("text")
+            if data is None:
+                data = frame.get("bytes")
+            if data is None:
+                continue
+            
+            # Commands are tiny, anything bigger is a misbehaving client
+            size = len(data) if isinstance(data, bytes) else len(data.encode("utf-8"))
+            if size > WS_MAX_COMMAND_BYTES:
+                await websocket.close(code=1009, reason="Command too large")
+                break
+            
+            await handle_command(websocket, data)
             
     except WebSocketDisconnect:
         # Client disconnected
+        pass
+    finally:
         manager.disconnect(websocket)
 
+
+def negotiate_encoding(websocket: WebSocket, requested: str) -> Tuple[str, Optional[str]]:
+    """
+    Choose the message encoding for a connection.
+    
+    Returns:
+        (encoding, subprotocol to accept or None)
+    """
+    available = available_encodings()
+    
+    for offered in websocket.scope.get("subprotocols", []):
+        if SUBPROTOCOLS.get(offered) in available:
+            return SUBPROTOCOLS[offered], offered
+    
+    return (requested if requested in available else JSON), None
+
+
+async def send_snapshot(websocket: WebSocket):
+    """
+    Send the shared feed snapshot, then register the connection.
+    
+    Events broadcast after the snapshot was built are sent right after
+    it, in seq order, until the client has caught up. Registering happens
+    synchronously after the last history check, so no live event can
+    overtake a replayed one and none is missed.
+    """
+    encoding = websocket.state.encoding
+    payload, seq = await feed_snapshot.get(encoding)
+    
+    while True:
+        missed = manager.events_since(seq)
+        if missed is None:
+            # History rolled over while the snapshot was stale (or being sent), rebuild it
+            feed_snapshot.invalidate()
+            payload, seq = await feed_snapshot.get(encoding)
+            continue
+        
+        if payload is not None:
+            await manager.send_encoded(websocket, payload)
+            payload = None
+            continue
+        
+        if not missed:
+            break
+        for message in missed:
+            await manager.send(websocket, message)
+        seq = missed[-1]["seq"]
+    
+    manager.register(websocket)
+
+
+async def send_error(websocket: WebSocket, detail: str):
+    """Tell the client its command was rejected."""
+    await manager.send(websocket, {"type": "ERROR", "data": {"detail": detail}})
+
+
+async def handle_command(websocket: WebSocket, data):
+    """Decode, validate and execute one client command."""
+    try:
+        raw = decode(data, websocket.state.encoding)
+        command = WebSocketCommand.model_validate({"command": raw}).command
+    except ValidationError as exc:
+        await send_error(websocket, f"Invalid command: {exc.errors()[0]['msg']}")
+        return
+    except ValueError:
+        await send_error(websocket, "Malformed frame")
+        return
+    
+    if command.type in ("subscribe", "unsubscribe"):
+        unknown = set(command.events) - EVENT_TYPES
+        if unknown:
+            await send_error(websocket, f"Unknown event types: {sorted(unknown)}")
+            return
+        
+        if command.type == "subscribe":
+            websocket.state.events = set(command.events)
+        else:
+            current = websocket.state.events
+            websocket.state.events = (EVENT_TYPES if current is None else current) - set(command.events)
+    
+    elif command.type == "ack":
+        websocket.state.acked_seq = max(websocket.state.acked_seq, command.seq)
+    
+    elif command.type == "ping":
+        await manager.send(websocket, {
+            "type": "PONG",
+            "data": {"id": command.id, "seq": manager.sequence, "epoch": manager.epoch}
+        })
+    
+    elif command.type == "resume":
+        missed = await manager.replay_since(command.seq, command.epoch)
+        if missed is None:
+            await manager.send(websocket, {
+                "type": "RESYNC_REQUIRED",
+                "data": {"seq": manager.sequence, "epoch": manager.epoch}
+            })
+            return
+        
+        for message in missed:
+            if manager.wants(websocket, message["type"]):
+                await manager.send(websocket, message)
@@ -16,9 +16,23 @@ from app.schemas.question import (
     QuestionStatusUpdate,
     QuestionResponse,
     QuestionPaginatedResponse,
+    ArchivedQuestionResponse,
+    ArchivedQuestionPaginatedResponse,
+    QuestionStatsResponse,
+    VoteResponse,
+    QueueClaimResponse,
     WebSocketMessage,
 )
 
+from app.schemas.websocket import (
+    SubscribeCommand,
+    UnsubscribeCommand,
+    AckCommand,
+    PingCommand,
+    ResumeCommand,
+    WebSocketCommand,
+)
+
 __all__ = [
     # User schemas
     "UserRegister",
@@ -31,5 +45,17 @@ __all__ = [
     "QuestionStatusUpdate",
     "QuestionResponse",
     "QuestionPaginatedResponse",
+    "ArchivedQuestionResponse",
+    "ArchivedQuestionPaginatedResponse",
+    "QuestionStatsResponse",
+    "VoteResponse",
+    "QueueClaimResponse",
     "WebSocketMessage",
+    # WebSocket command schemas
+    "SubscribeCommand",
+    "UnsubscribeCommand",
+    "AckCommand",
+    "PingCommand",
+    "ResumeCommand",
+    "WebSocketCommand",
 ]
@@ -5,7 +5,7 @@ Defines request/response shapes for question-related endpoints.
 
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict
 
 
 # ─────────────────────────────────────────────────────────────────
@@ -53,6 +53,7 @@ class QuestionResponse(BaseModel):
     answer: Optional[str] = None
     answered_by: Optional[int] = None
     answered_at: Optional[datetime] = None
+    votes: int = 0
 
     class Config:
         from_attributes = True  # Allows converting SQLAlchemy model to Pydantic
@@ -68,6 +69,55 @@ class QuestionPaginatedResponse(BaseModel):
     has_more: bool
 
 
+class ArchivedQuestionResponse(QuestionResponse):
+    """
+    Schema for archived question data in responses.
+    Same as QuestionResponse plus when it was archived.
+    """
+    archived_at: Optional[datetime] = None
+
+
+class ArchivedQuestionPaginatedResponse(BaseModel):
+    """
+    Schema for paginated archive responses.
+    Cursor is the last question_id of the previous page (newest first).
+    """
+    questions: List[ArchivedQuestionResponse]
+    next_cursor: Optional[int] = None
+    has_more: bool
+
+
+class QuestionStatsResponse(BaseModel):
+    """
+    Schema for dashboard statistics.
+    Also the data of the STATS_UPDATED WebSocket event.
+    """
+    counts: Dict[str, int]
+    total: int
+    unanswered: int
+    mean_time_to_answer_seconds: Optional[float] = None
+
+
+class VoteResponse(BaseModel):
+    """
+    Schema for vote responses.
+    Votes are queued in memory, so only the accepted delta is returned;
+    the new total arrives later via the VOTES_UPDATED WebSocket event.
+    """
+    question_id: int
+    queued: int
+
+
+class QueueClaimResponse(BaseModel):
+    """
+    Schema for moderator work queue claims.
+    question is None when there is nothing left to claim.
+    """
+    question: Optional[QuestionResponse] = None
+    lease_expires_at: Optional[datetime] = None
+    queue_length: int
+
+
 # ─────────────────────────────────────────────────────────────────
 # WEBSOCKET MESSAGE SCHEMAS
 # ─────────────────────────────────────────────────────────────────
@@ -75,9 +125,13 @@ class QuestionPaginatedResponse(BaseModel):
 class WebSocketMessage(BaseModel):
     """
     Schema for WebSocket broadcast messages.
-    type: "NEW_QUESTION", "QUESTION_ANSWERED", "QUESTION_UPDATED"
+    type: "NEW_QUESTION", "QUESTION_ANSWERED", "QUESTION_UPDATED", "VOTES_UPDATED"
     data: The question data
+    seq: Event sequence number (increases by one per broadcast)
+    epoch: Identifies the sequence space seq belongs to (changes when seq restarts)
     """
     type: str
     data: dict
+    seq: Optional[int] = None
+    epoch: Optional[str] = None
 
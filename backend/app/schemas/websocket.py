@@ -0,0 +1,71 @@
+"""
+WebSocket schemas.
+Defines the commands clients may send over /ws.
+"""
+
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional, Union
+
+
+# ─────────────────────────────────────────────────────────────────
+# CLIENT COMMANDS (what client sends over /ws)
+# ─────────────────────────────────────────────────────────────────
+
+class SubscribeCommand(BaseModel):
+    """
+    Receive only the listed event types (replaces the current filter).
+    Client sends: {"type": "subscribe", "events": ["NEW_QUESTION", ...]}
+    """
+    type: Literal["subscribe"]
+    events: List[str] = Field(max_length=32)
+
+
+class UnsubscribeCommand(BaseModel):
+    """
+    Stop receiving the listed event types.
+    Client sends: {"type": "unsubscribe", "events": ["STATS_UPDATED"]}
+    """
+    type: Literal["unsubscribe"]
+    events: List[str] = Field(max_length=32)
+
+
+class AckCommand(BaseModel):
+    """
+    Confirm all events up to seq have been processed.
+    Client sends: {"type": "ack", "seq": 42}
+    """
+    type: Literal["ack"]
+    seq: int = Field(ge=0)
+
+
+class PingCommand(BaseModel):
+    """
+    Application-level ping, answered with PONG and the current seq.
+    Client sends: {"type": "ping"}
+    """
+    type: Literal["ping"]
+    id: Optional[int] = None
+
+
+class ResumeCommand(BaseModel):
+    """
+    Replay buffered events after seq (RESYNC_REQUIRED if no longer buffered,
+    or if epoch is not the server's current one).
+    Client sends: {"type": "resume", "seq": 42, "epoch": "3f9a1c2e"}
+    """
+    type: Literal["resume"]
+    seq: int = Field(ge=0)
+    epoch: Optional[str] = Field(default=None, max_length=64)
+
+
+class WebSocketCommand(BaseModel):
+    """
+    Envelope used to validate any client command by its "type".
+    """
+    command: Union[
+        SubscribeCommand,
+        UnsubscribeCommand,
+        AckCommand,
+        PingCommand,
+        ResumeCommand,
+    ] = Field(discriminator="type")
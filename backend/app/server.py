@@ -0,0 +1,153 @@
+"""
+Production server runner.
+Runs the app with uvloop/httptools, tuned keep-alive and WebSocket limits,
+and graceful shutdown that closes WebSocket clients cleanly.
+
+Usage:
+    python -m app.server                      # single uvicorn process (WEB_CONCURRENCY=1)
+    WEB_CONCURRENCY=4 python -m app.server    # 4 workers via gunicorn (events are per worker)
+    gunicorn -c gunicorn.conf.py app.main:app # same settings, plain gunicorn
+"""
+
+import importlib.util
+import sys
+
+import uvicorn
+
+from app.config import (
+    SERVER_HOST,
+    SERVER_PORT,
+    WEB_CONCURRENCY,
+    SERVER_LOOP,
+    SERVER_HTTP,
+    SERVER_KEEP_ALIVE_SECONDS,
+    GRACEFUL_SHUTDOWN_SECONDS,
+    WS_PING_INTERVAL_SECONDS,
+    WS_PING_TIMEOUT_SECONDS,
+    WS_MAX_SIZE_BYTES,
+)
+from app.services.websocket import manager
+
+
+APP = "app.main:app"
+
+
+def _available(module: str) -> bool:
+    """Check if an optional module can be imported."""
+    return importlib.util.find_spec(module) is not None
+
+
+def uvicorn_options() -> dict:
+    """
+    Uvicorn settings shared by the single-process runner and the gunicorn worker.
+    uvloop and httptools are used when installed (not available on Windows).
+    """
+    loop = SERVER_LOOP
+    if loop == "uvloop" and not _available("uvloop"):
+        loop = "asyncio"
+
+    http = SERVER_HTTP
+    if http == "httptools" and not _available("httptools"):
+        http = "h11"
+
+    return {
+        "loop": loop,
+        "http": http,
+        "timeout_keep_alive": SERVER_KEEP_ALIVE_SECONDS,
+        "timeout_graceful_shutdown": GRACEFUL_SHUTDOWN_SECONDS,
+        "ws_ping_interval": WS_PING_INTERVAL_SECONDS,
+        "ws_ping_timeout": WS_PING_TIMEOUT_SECONDS,
+        "ws_max_size": WS_MAX_SIZE_BYTES,
+    }
+
+
+class DrainingServer(uvicorn.Server):
+    """
+    Uvicorn server that closes app WebSocket clients before shutting down.
+
+    Plain uvicorn aborts open WebSockets with code 1012 before the app's
+    shutdown handlers run. Closing them through ConnectionManager first
+    sends a normal 1001 "going away" frame, so clients reconnect right
+    away (to another worker during a rolling restart).
+    """
+
+    async def shutdown(self, sockets=None):
+        await manager.close_all()
+        await super().shutdown(sockets=sockets)
+
+
+# Gunicorn is not available on Windows, the single-process runner still works there
+if _available("gunicorn"):
+    from gunicorn.app.base import BaseApplication
+    from gunicorn.arbiter import Arbiter
+    from uvicorn.workers import UvicornWorker
+
+    class Worker(UvicornWorker):
+        """
+        Gunicorn worker running DrainingServer with the tuned uvicorn settings.
+
+        _serve mirrors UvicornWorker._serve (unchanged from uvicorn 0.27 to
+        0.54, the range pinned in requirements.txt) with DrainingServer in
+        place of Server; uvicorn offers no public hook for the server class.
+        """
+
+        CONFIG_KWARGS = {**UvicornWorker.CONFIG_KWARGS, **uvicorn_options()}
+
+        async def _serve(self) -> None:
+            self.config.app = self.wsgi
+            server = DrainingServer(config=self.config)
+            self._install_sigquit_handler()
+            await server.serve(sockets=self.sockets)
+            if not server.started:
+                sys.exit(Arbiter.WORKER_BOOT_ERROR)
+
+    class GunicornApplication(BaseApplication):
+        """Runs gunicorn in-process with settings from gunicorn_options()."""
+
+        def __init__(self, options: dict):
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            from app.main import app
+            return app
+
+
+def gunicorn_options() -> dict:
+    """Gunicorn settings, also loaded by gunicorn.conf.py."""
+    return {
+        "bind": f"{SERVER_HOST}:{SERVER_PORT}",
+        "workers": WEB_CONCURRENCY,
+        "worker_class": "app.server.Worker",
+        "keepalive": SERVER_KEEP_ALIVE_SECONDS,
+        "graceful_timeout": GRACEFUL_SHUTDOWN_SECONDS,
+        # Workers are async, a long request does not mean a stuck worker
+        "timeout": GRACEFUL_SHUTDOWN_SECONDS * 2,
+    }
+
+
+def main():
+    """Start the server with WEB_CONCURRENCY workers."""
+    if WEB_CONCURRENCY > 1:
+        print(
+            f"! WEB_CONCURRENCY={WEB_CONCURRENCY}: WebSocket/SSE events, snapshots and the "
+            "work queue are per worker, clients only see events published by their own worker"
+        )
+    if WEB_CONCURRENCY > 1 and _available("gunicorn"):
+        GunicornApplication(gunicorn_options()).run()
+        return
+
+    config = uvicorn.Config(APP, host=SERVER_HOST, port=SERVER_PORT, **uvicorn_options())
+    try:
+        DrainingServer(config).run()
+    except KeyboardInterrupt:
+        # uvicorn re-raises the captured Ctrl+C after shutting down; uvicorn.run swallows it too
+        pass
+
+
+if __name__ == "__main__":
+    main()
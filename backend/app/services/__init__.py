@@ -10,6 +10,15 @@ from app.services.auth import (
     verify_access_token,
 )
 from app.services.websocket import manager
+from app.services.votes import vote_aggregator
+from app.services.group_commit import question_writer
+from app.services.rate_limit import rate_limiter, write_admission
+from app.services.retention import retention_job
+from app.services.stats import question_stats
+from app.services.snapshot import feed_snapshot
+from app.services.work_queue import moderator_queue
+from app.services.journal import event_journal
+from app.services.broadcast_shards import broadcast_shards
 
 __all__ = [
     "hash_password",
@@ -17,4 +26,14 @@ __all__ = [
     "create_access_token",
     "verify_access_token",
     "manager",
+    "vote_aggregator",
+    "question_writer",
+    "rate_limiter",
+    "write_admission",
+    "retention_job",
+    "question_stats",
+    "feed_snapshot",
+    "moderator_queue",
+    "event_journal",
+    "broadcast_shards",
 ]
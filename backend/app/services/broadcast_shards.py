@@ -0,0 +1,360 @@
+"""
+Broadcast shard service.
+Fans events out to WebSocket clients from several event loops (threads or child processes).
+"""
+
+import asyncio
+import multiprocessing
+import os
+import signal
+import socket
+import struct
+import threading
+from collections import deque
+from typing import Deque, List, Optional, Set
+
+from websockets.asyncio.server import broadcast, serve
+
+from app.config import (
+    BROADCAST_SHARDS,
+    BROADCAST_SHARD_MODE,
+    BROADCAST_SHARD_PORT,
+    SERVER_HOST,
+    WS_PING_INTERVAL_SECONDS,
+    WS_PING_TIMEOUT_SECONDS,
+)
+from app.services.encoding import JSON, encode
+
+
+# Frames on the pipe to a shard process: 4-byte length, then the encoded event
+FRAME_HEADER = struct.Struct("<I")
+
+# A shard process this far behind is dropping frames instead of buffering more
+MAX_PIPE_BACKLOG_BYTES = 64 * 1024 * 1024
+
+# Clients whose unsent data exceeds this are disconnected (they reconnect and resync)
+MAX_CLIENT_BUFFER_BYTES = 4 * 1024 * 1024
+
+# Shard processes import the app's services, which takes a moment
+SHARD_START_TIMEOUT_SECONDS = 30
+
+
+def _listen_socket(host: str, port: int) -> socket.socket:
+    """
+    Listening socket with SO_REUSEPORT, so every shard binds the same port
+    and the kernel spreads new connections across them.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    sock.listen(1024)
+    sock.setblocking(False)
+    return sock
+
+
+class ShardServer:
+    """
+    WebSocket server owning one shard's connections, on its own event loop.
+    Clients only receive events; anything they send is ignored.
+    """
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.connections: Set = set()
+        self._server = None
+
+    async def _handler(self, websocket):
+        self.connections.add(websocket)
+        try:
+            await websocket.wait_closed()
+        finally:
+            self.connections.discard(websocket)
+
+    async def start(self):
+        self._server = await serve(
+            self._handler,
+            sock=_listen_socket(self.host, self.port),
+            ping_interval=WS_PING_INTERVAL_SECONDS,
+            ping_timeout=WS_PING_TIMEOUT_SECONDS,
+        )
+
+    def deliver(self, frame: str):
+        """Write one pre-encoded event to every connection of this shard."""
+        for websocket in list(self.connections):
+            if websocket.transport.get_write_buffer_size() > MAX_CLIENT_BUFFER_BYTES:
+                self.connections.discard(websocket)
+                websocket.transport.abort()
+        broadcast(self.connections, frame)
+
+    async def stop(self):
+        """Close every client with 1001 so it reconnects."""
+        if self._server is not None:
+            self._server.close(close_connections=True)
+            await self._server.wait_closed()
+
+
+# ─────────────────────────────────────────────────────────────────
+# THREAD SHARDS
+# ─────────────────────────────────────────────────────────────────
+
+class ShardThread(threading.Thread):
+    """
+    Shard running its own event loop in a thread of this process.
+
+    The app loop appends frames to a deque (append/popleft are atomic, so
+    a single producer and consumer need no lock) and wakes the shard loop
+    only when it is not already scheduled to drain.
+    """
+
+    def __init__(self, index: int, host: str, port: int):
+        super().__init__(name=f"broadcast-shard-{index}", daemon=True)
+        self.server = ShardServer(host, port)
+        self.queue: Deque[str] = deque()
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake_pending = False
+        self.ready = threading.Event()
+
+    def run(self):
+        self.loop = asyncio.new_event_loop()
+        self.loop.run_until_complete(self.server.start())
+        self.ready.set()
+        self.loop.run_forever()
+        self.loop.run_until_complete(self.server.stop())
+        self.loop.close()
+
+    def _drain(self):
+        self._wake_pending = False
+        while self.queue:
+            self.server.deliver(self.queue.popleft())
+
+    def push(self, frame: str):
+        if self.loop.is_closed():  # The shard thread has exited
+            return
+        self.queue.append(frame)
+        if not self._wake_pending:
+            self._wake_pending = True
+            self.loop.call_soon_threadsafe(self._drain)
+
+    async def stop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        await asyncio.to_thread(self.join)
+
+
+# ─────────────────────────────────────────────────────────────────
+# PROCESS SHARDS
+# ─────────────────────────────────────────────────────────────────
+
+def _run_shard_process(host: str, port: int, reader, ready):
+    """Entry point of a shard process: read frames from the pipe and fan them out."""
+    # Ctrl+C reaches the whole process group; the parent stops us by closing the pipe
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    async def main():
+        server = ShardServer(host, port)
+        await server.start()
+        ready.set()
+
+        loop = asyncio.get_running_loop()
+        closed = loop.create_future()
+        buffer = bytearray()
+        fd = reader.fileno()
+
+        def on_readable():
+            data = os.read(fd, 1024 * 1024)
+            if not data:
+                loop.remove_reader(fd)
+                closed.set_result(None)
+                return
+            buffer.extend(data)
+            offset = 0
+            while len(buffer) - offset >= FRAME_HEADER.size:
+                (length,) = FRAME_HEADER.unpack_from(buffer, offset)
+                end = offset + FRAME_HEADER.size + length
+                if end > len(buffer):
+                    break
+                server.deliver(buffer[offset + FRAME_HEADER.size:end].decode())
+                offset = end
+            del buffer[:offset]
+
+        loop.add_reader(fd, on_readable)
+        loop.add_signal_handler(signal.SIGTERM, lambda: closed.done() or closed.set_result(None))
+        await closed
+        await server.stop()
+
+    try:
+        import uvloop
+        run = uvloop.run
+    except ImportError:  # Optional: not available on Windows
+        run = asyncio.run
+    run(main())
+
+
+class ShardProcess:
+    """
+    Shard running in a child process that binds the same port.
+
+    Frames go through a pipe written without blocking from the app loop;
+    if the pipe is full the rest is buffered and written when it drains.
+    If the child dies the shard is marked dead and skipped from then on;
+    its clients reconnect to the remaining shards.
+    """
+
+    def __init__(self, index: int, host: str, port: int):
+        context = multiprocessing.get_context("spawn")
+        reader, self.writer = context.Pipe(duplex=False)
+        self.ready = context.Event()
+        self.process = context.Process(
+            target=_run_shard_process,
+            args=(host, port, reader, self.ready),
+            name=f"broadcast-shard-{index}",
+            daemon=True,
+        )
+        self.index = index
+        self._reader = reader
+        self._fd = self.writer.fileno()
+        self._backlog = bytearray()
+        self.dropped = 0
+        self.alive = True
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def start(self):
+        self.loop = asyncio.get_running_loop()
+        self.process.start()
+        self._reader.close()
+        os.set_blocking(self._fd, False)
+
+    def _mark_dead(self, exc: OSError):
+        """Stop writing to a shard whose process is gone."""
+        self.alive = False
+        self.loop.remove_writer(self._fd)
+        self._backlog.clear()
+        print(f"✗ Broadcast shard {self.index} died ({exc}), no longer publishing to it")
+
+    def _write_backlog(self):
+        try:
+            written = os.write(self._fd, self._backlog)
+        except BlockingIOError:
+            return
+        except OSError as exc:  # BrokenPipeError: the child exited
+            self._mark_dead(exc)
+            return
+        del self._backlog[:written]
+        if not self._backlog:
+            self.loop.remove_writer(self._fd)
+
+    def push(self, frame: str):
+        if not self.alive:
+            return
+        data = frame.encode()
+        record = FRAME_HEADER.pack(len(data)) + data
+
+        if self._backlog:
+            if len(self._backlog) > MAX_PIPE_BACKLOG_BYTES:
+                self.dropped += 1
+                return
+            self._backlog += record
+            return
+
+        try:
+            written = os.write(self._fd, record)
+        except BlockingIOError:
+            written = 0
+        except OSError as exc:  # BrokenPipeError: the child exited
+            self._mark_dead(exc)
+            return
+        if written < len(record):
+            self._backlog += record[written:]
+            self.loop.add_writer(self._fd, self._write_backlog)
+
+    async def stop(self):
+        # Give the shard what is still buffered, then EOF tells it to close its clients
+        for _ in range(100):
+            if not self._backlog:
+                break
+            await asyncio.sleep(0.01)
+        self.loop.remove_writer(self._fd)
+        self.writer.close()
+        await asyncio.to_thread(self.process.join, 10)
+        if self.process.is_alive():
+            self.process.terminate()
+
+
+# ─────────────────────────────────────────────────────────────────
+# DISPATCHER
+# ─────────────────────────────────────────────────────────────────
+
+class BroadcastShards:
+    """
+    Sharded broadcast endpoint on BROADCAST_SHARD_PORT.
+
+    One ConnectionManager loop caps how many sockets can be written per
+    second. With BROADCAST_SHARDS > 0, each shard runs its own event loop
+    and owns the clients the kernel hands it (SO_REUSEPORT). Every event
+    is encoded once here and the same frame is pushed to each shard.
+
+    Modes:
+    - "process": child processes, so shards use separate cores.
+    - "thread": threads in this process; cheaper, but shards share the GIL.
+
+    Shard clients get every event as JSON text, like /ws without a
+    snapshot or commands; load the feed with GET /questions/ first.
+
+    Usage:
+        await broadcast_shards.start()
+        broadcast_shards.publish(message)
+    """
+
+    def __init__(
+        self,
+        shards: int = BROADCAST_SHARDS,
+        mode: str = BROADCAST_SHARD_MODE,
+        host: str = SERVER_HOST,
+        port: int = BROADCAST_SHARD_PORT,
+    ):
+        if mode not in ("process", "thread"):
+            raise ValueError(f"Unknown broadcast shard mode: {mode}")
+        self.count = shards
+        self.mode = mode
+        self.host = host
+        self.port = port
+        self.shards: List = []
+
+    async def start(self):
+        """Start the shards and wait until all of them accept connections."""
+        if self.shards:
+            return
+        shard_class = ShardProcess if self.mode == "process" else ShardThread
+        self.shards = [shard_class(index, self.host, self.port) for index in range(self.count)]
+        for shard in self.shards:
+            shard.start()
+
+        started = await asyncio.gather(*[
+            asyncio.to_thread(shard.ready.wait, SHARD_START_TIMEOUT_SECONDS)
+            for shard in self.shards
+        ])
+        if not all(started):
+            await self.stop()
+            raise RuntimeError(f"Broadcast shards did not start on port {self.port}")
+
+    def publish(self, message: dict):
+        """
+        Encode a message once and queue it on every shard.
+        Never raises: a failing shard must not break publishing for the app.
+        """
+        frame = encode(message, JSON)
+        for shard in self.shards:
+            try:
+                shard.push(frame)
+            except Exception as exc:
+                print(f"✗ Broadcast shard push failed: {exc}")
+
+    async def stop(self):
+        """Stop all shards; their clients are closed with 1001."""
+        shards, self.shards = self.shards, []
+        await asyncio.gather(*[shard.stop() for shard in shards])
+
+
+# Single instance shared across the app
+broadcast_shards = BroadcastShards()
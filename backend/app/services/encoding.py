@@ -0,0 +1,48 @@
+"""
+Encoding service.
+Encodes and decodes WebSocket messages as JSON text or MessagePack binary frames.
+"""
+
+import json
+from typing import Union
+
+try:
+    import msgpack
+except ImportError:  # Optional: without it only JSON is offered
+    msgpack = None
+
+
+JSON = "json"
+MSGPACK = "msgpack"
+
+# WebSocket subprotocol names clients can offer to pick an encoding
+SUBPROTOCOLS = {
+    "qa.json": JSON,
+    "qa.msgpack": MSGPACK,
+}
+
+
+def available_encodings() -> list:
+    """Encodings this server can speak."""
+    return [JSON, MSGPACK] if msgpack else [JSON]
+
+
+def encode(message: dict, encoding: str = JSON) -> Union[str, bytes]:
+    """Encode a message as a JSON string or MessagePack bytes."""
+    if encoding == MSGPACK:
+        return msgpack.packb(message)
+    return json.dumps(message)
+
+
+def decode(frame: Union[str, bytes], encoding: str = JSON):
+    """
+    Decode a client frame.
+    Text frames are always JSON; binary frames use the negotiated encoding.
+    Raises ValueError if the frame cannot be decoded.
+    """
+    if isinstance(frame, str) or encoding == JSON:
+        return json.loads(frame)
+    try:
+        return msgpack.unpackb(frame)
+    except Exception as exc:
+        raise ValueError(str(exc))
@@ -0,0 +1,104 @@
+"""
+Export service.
+Streams questions as NDJSON or CSV without loading them into memory.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Iterator, Optional
+
+from sqlalchemy import select
+
+from app.config import EXPORT_BATCH_SIZE
+from app.database import ReadSessionLocal
+from app.models.question import Question
+from app.models.archived_question import ArchivedQuestion
+
+
+EXPORT_COLUMNS = [
+    "question_id",
+    "message",
+    "status",
+    "timestamp",
+    "answer",
+    "answered_by",
+    "answered_at",
+    "votes",
+]
+
+
+def iter_question_rows(
+    status: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    include_archived: bool = False,
+) -> Iterator[tuple]:
+    """
+    Yield question rows (tuples in EXPORT_COLUMNS order) matching the filters.
+
+    Uses stream_results + yield_per so rows are fetched in batches of
+    EXPORT_BATCH_SIZE through a server-side cursor on Postgres, keeping
+    memory constant regardless of table size. Reads from the replica
+    when one is configured. Live questions come first, then archived
+    ones, each ordered by question_id.
+    """
+    models = [Question, ArchivedQuestion] if include_archived else [Question]
+
+    db = ReadSessionLocal()
+    try:
+        for model in models:
+            query = select(*[getattr(model, name) for name in EXPORT_COLUMNS])
+            if status:
+                query = query.where(model.status == status)
+            if since:
+                query = query.where(model.timestamp >= since)
+            if until:
+                query = query.where(model.timestamp < until)
+
+            result = db.execute(
+                query.order_by(model.question_id).execution_options(
+                    stream_results=True,
+                    yield_per=EXPORT_BATCH_SIZE,
+                )
+            )
+            for row in result:
+                yield tuple(row)
+    finally:
+        db.close()
+
+
+def _format_value(value):
+    """Convert datetimes to ISO strings, leave everything else as is."""
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def stream_ndjson(rows: Iterator[tuple]) -> Iterator[str]:
+    """Encode rows as newline-delimited JSON, one chunk per batch."""
+    chunk = []
+    for row in rows:
+        chunk.append(json.dumps(dict(zip(EXPORT_COLUMNS, map(_format_value, row)))))
+        if len(chunk) >= EXPORT_BATCH_SIZE:
+            yield "\n".join(chunk) + "\n"
+            chunk = []
+    if chunk:
+        yield "\n".join(chunk) + "\n"
+
+
+def stream_csv(rows: Iterator[tuple]) -> Iterator[str]:
+    """Encode rows as CSV with a header line, one chunk per batch."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+
+    count = 0
+    for row in rows:
+        writer.writerow(map(_format_value, row))
+        count += 1
+        if count >= EXPORT_BATCH_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            count = 0
+    yield buffer.getvalue()
@@ -0,0 +1,84 @@
+"""
+Feed service.
+Builds pages of the live question feed, shared by the REST endpoint and the WebSocket snapshot.
+"""
+
+from typing import Optional
+
+from sqlalchemy import and_, case, or_, select
+from sqlalchemy.orm import Session
+
+from app.models.question import Question
+
+
+def get_feed_page(db: Session, limit: int, cursor: Optional[int] = None, sort: str = "status") -> dict:
+    """
+    Fetch one page of the feed.
+    
+    Args:
+        db: Database session
+        limit: Number of questions per page
+        cursor: Last question_id from the previous page; the next page
+                starts after that question's position in the sort order
+        sort: "status" (Escalated > Pending > Answered, newest first)
+              or "votes" (most votes first, newest first)
+    
+    Returns:
+        {"questions": [Question, ...], "next_cursor": int | None, "has_more": bool}
+    """
+    # Custom sort order: Escalated > Pending > Answered
+    status_order = case(
+        (Question.status == "Escalated", 1),
+        (Question.status == "Pending", 2),
+        (Question.status == "Answered", 3),
+        else_=4
+    )
+    
+    # Sort keys as (expression, ascending); question_id breaks ties so the order is total
+    if sort == "votes":
+        keys = [(Question.votes, False), (Question.timestamp, False), (Question.question_id, False)]
+    else:
+        keys = [(status_order, True), (Question.timestamp, False), (Question.question_id, False)]
+    
+    # Build base query
+    query = db.query(Question)
+    
+    # Keyset pagination: continue after the cursor question's position in the sort order.
+    # The cursor's key values are read by subqueries, so comparisons stay in SQL
+    # (SQLite stores timestamps as text and a Python round trip would change them).
+    if cursor:
+        if not db.query(Question.question_id).filter(Question.question_id == cursor).first():
+            # Cursor question was deleted meanwhile, fall back to id order
+            query = query.filter(Question.question_id < cursor)
+        else:
+            anchor = [
+                select(expression).where(Question.question_id == cursor).scalar_subquery()
+                for expression, _ in keys
+            ]
+            conditions = []
+            for index, (expression, ascending) in enumerate(keys):
+                beyond = expression > anchor[index] if ascending else expression < anchor[index]
+                equal_before = [keys[i][0] == anchor[i] for i in range(index)]
+                conditions.append(and_(*equal_before, beyond))
+            query = query.filter(or_(*conditions))
+    
+    # Apply sorting and fetch limit + 1 to check if there are more
+    query = query.order_by(*[
+        expression.asc() if ascending else expression.desc() for expression, ascending in keys
+    ])
+    
+    questions = query.limit(limit + 1).all()
+    
+    # Check if there are more questions
+    has_more = len(questions) > limit
+    if has_more:
+        questions = questions[:limit]  # Remove the extra one
+    
+    # Get next cursor (last question_id if there are more)
+    next_cursor = questions[-1].question_id if questions and has_more else None
+    
+    return {
+        "questions": questions,
+        "next_cursor": next_cursor,
+        "has_more": has_more
+    }
@@ -0,0 +1,143 @@
+"""
+Group commit service.
+Batches question submissions into shared insert transactions.
+"""
+
+import asyncio
+from typing import List, Optional, Tuple
+
+from sqlalchemy import insert
+
+from app.config import GROUP_COMMIT_MAX_BATCH, GROUP_COMMIT_MAX_DELAY_MS
+from app.database import SessionLocal
+from app.models.question import Question
+from app.services.websocket import manager
+
+
+class GroupCommitWriter:
+    """
+    Queues new questions and inserts them in small transactions.
+
+    A batch is closed when it reaches max_batch rows or when max_delay_ms
+    has passed since its first row arrived. The whole batch is inserted
+    in one transaction with one commit (one fsync), each waiting request
+    is handed its own row, and the NEW_QUESTION events go out in one pass.
+    The rows come back in submission order; SQLAlchemy needs one INSERT
+    per row for that on SQLite, and batches them into multi-row
+    statements on PostgreSQL.
+    """
+
+    def __init__(
+        self,
+        max_batch: int = GROUP_COMMIT_MAX_BATCH,
+        max_delay_ms: float = GROUP_COMMIT_MAX_DELAY_MS,
+    ):
+        self.max_batch = max_batch
+        self.max_delay = max_delay_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def submit(self, message: str) -> dict:
+        """Queue a question and wait until its row has been committed."""
+        if self._task is None or self._task.done():
+            raise RuntimeError("Group commit writer is not running")
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((message, future))
+        return await future
+
+    def _insert(self, messages: List[str]) -> List[dict]:
+        """Insert all messages in one transaction and return the new rows, in order."""
+        db = SessionLocal()
+        try:
+            questions = db.scalars(
+                insert(Question).returning(Question, sort_by_parameter_order=True),
+                [{"message": message, "status": "Pending"} for message in messages]
+            ).all()
+
+            # Read the rows before commit expires them
+            rows = [
+                {
+                    "question_id": question.question_id,
+                    "message": question.message,
+                    "status": question.status,
+                    "timestamp": question.timestamp.isoformat(),
+                    "answer": question.answer,
+                    "answered_by": question.answered_by,
+                    "answered_at": None,
+                    "votes": question.votes
+                }
+                for question in questions
+            ]
+            db.commit()
+            return rows
+        finally:
+            db.close()
+
+    async def _commit(self, batch: List[Tuple[str, asyncio.Future]]):
+        """Write one batch and resolve its waiting requests."""
+        try:
+            rows = await asyncio.to_thread(self._insert, [message for message, _ in batch])
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for (_, future), row in zip(batch, rows):
+            if not future.done():
+                future.set_result(row)
+
+        # The rows are committed and the requests answered; a failed
+        # broadcast must not take the writer loop down with it
+        try:
+            await manager.broadcast_many([
+                {"type": "NEW_QUESTION", "data": row} for row in rows
+            ])
+        except Exception as exc:
+            print(f"✗ Group commit broadcast failed: {exc}")
+
+    async def _run(self):
+        """Collect batches until a None sentinel is received."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            item = await self._queue.get()
+            if item is None:
+                break
+
+            batch = [item]
+            deadline = loop.time() + self.max_delay
+
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._commit(batch)
+
+    def start(self):
+        """Start the background batching loop."""
+        if self._task is None:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Commit everything already queued, then stop the loop."""
+        if self._task is not None:
+            await self._queue.put(None)
+            await self._task
+            self._task = None
+
+
+# Single instance shared across the app
+question_writer = GroupCommitWriter()
@@ -0,0 +1,416 @@
+"""
+Event journal service.
+Append-only on-disk log of every broadcast event, for resume after restarts and audit export.
+"""
+
+import asyncio
+import bisect
+import itertools
+import json
+import mmap
+import os
+import secrets
+import struct
+import threading
+import time
+import zlib
+from typing import Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows: a single process owns the journal
+    fcntl = None
+
+from app.config import (
+    EVENT_JOURNAL_DIR,
+    EVENT_JOURNAL_SEGMENT_BYTES,
+    EVENT_JOURNAL_FSYNC_MS,
+    EVENT_JOURNAL_RETENTION_DAYS,
+    EVENT_JOURNAL_MAX_BYTES,
+    EVENT_JOURNAL_COMPACT_INTERVAL_SECONDS,
+    EVENT_JOURNAL_MAX_REPLAY,
+)
+
+
+# Record layout: payload length, seq, CRC32 of payload, then the JSON payload
+HEADER = struct.Struct("<IQI")
+
+# One sparse index entry every N records; reads scan at most N headers to their start
+INDEX_INTERVAL = 64
+
+SEGMENT_SUFFIX = ".log"
+
+# File in a slot directory naming the sequence space its events belong to
+EPOCH_FILE = "EPOCH"
+
+
+class _Segment:
+    """One journal file holding a contiguous range of sequence numbers."""
+
+    def __init__(self, path: str, first_seq: int):
+        self.path = path
+        self.first_seq = first_seq
+        self.last_seq = first_seq - 1
+        self.size = 0      # Bytes appended, including ones still buffered
+        self.flushed = 0   # Bytes written and fsynced, safe to read
+        self.count = 0
+        self.index_seqs: List[int] = []
+        self.index_offsets: List[int] = []
+        self.file = None
+        self.map: Optional[mmap.mmap] = None  # Cached once the segment is sealed
+
+    def add(self, seq: int, length: int):
+        """Account for a record appended at the current end."""
+        if self.count % INDEX_INTERVAL == 0:
+            self.index_seqs.append(seq)
+            self.index_offsets.append(self.size)
+        self.count += 1
+        self.size += length
+        self.last_seq = seq
+
+
+def _scan(buffer, start: int, end: int) -> Iterator[Tuple[int, int, int, int]]:
+    """
+    Walk records in buffer[start:end].
+    Yields (offset, seq, payload start, payload end) and stops at the
+    first torn or corrupt record.
+    """
+    offset = start
+    while offset + HEADER.size <= end:
+        length, seq, crc = HEADER.unpack_from(buffer, offset)
+        payload_start = offset + HEADER.size
+        payload_end = payload_start + length
+        if payload_end > end or zlib.crc32(buffer[payload_start:payload_end]) != crc:
+            return
+        yield offset, seq, payload_start, payload_end
+        offset = payload_end
+
+
+class EventJournal:
+    """
+    Segmented append-only journal of broadcast events.
+
+    - Write path: append() only frames the record into an in-memory
+      buffer. A background task writes the buffer and fsyncs every
+      EVENT_JOURNAL_FSYNC_MS (group fsync), so broadcasts never wait for
+      the disk. A crash loses at most that window.
+    - Read path: segments are memory-mapped; a sparse seq -> offset index
+      per segment turns a range read into a bisect plus a short scan.
+    - Compaction: whole sealed segments past EVENT_JOURNAL_RETENTION_DAYS
+      or beyond EVENT_JOURNAL_MAX_BYTES are deleted periodically.
+
+    Each worker process owns one slot directory (slot-0, slot-1, ...)
+    claimed with a file lock, because sequence numbers are per worker.
+    The slot's EPOCH file names its sequence space; the worker that
+    claims the slot uses it in event ids, so resumes against a different
+    worker (or a wiped journal) are detected and answered with a resync.
+
+    Usage:
+        last_seq = event_journal.open()
+        event_journal.append(seq, message)
+        events = await event_journal.read_since(seq)
+    """
+
+    def __init__(
+        self,
+        directory: str = EVENT_JOURNAL_DIR,
+        segment_bytes: int = EVENT_JOURNAL_SEGMENT_BYTES,
+        fsync_ms: float = EVENT_JOURNAL_FSYNC_MS,
+        retention_days: float = EVENT_JOURNAL_RETENTION_DAYS,
+        max_bytes: int = EVENT_JOURNAL_MAX_BYTES,
+        compact_interval: float = EVENT_JOURNAL_COMPACT_INTERVAL_SECONDS,
+        max_replay: int = EVENT_JOURNAL_MAX_REPLAY,
+    ):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.fsync_interval = fsync_ms / 1000
+        self.retention_seconds = retention_days * 86400
+        self.max_bytes = max_bytes
+        self.compact_interval = compact_interval
+        self.max_replay = max_replay
+
+        self.path: Optional[str] = None
+        self.epoch: Optional[str] = None
+        self.segments: List[_Segment] = []
+        self._pending: List[Tuple[_Segment, bytes]] = []
+        self._lock_file = None
+        self._segments_lock = threading.Lock()
+        self._flush_lock = asyncio.Lock()
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def first_seq(self) -> int:
+        return self.segments[0].first_seq if self.segments else 1
+
+    @property
+    def last_seq(self) -> int:
+        return self.segments[-1].last_seq if self.segments else 0
+
+    # ─────────────────────────────────────────────────────────────
+    # OPEN / RECOVERY
+    # ─────────────────────────────────────────────────────────────
+
+    def _claim_slot(self):
+        """Lock the first slot directory no other process is using."""
+        for slot in itertools.count():
+            path = os.path.join(self.directory, f"slot-{slot}")
+            os.makedirs(path, exist_ok=True)
+            lock_file = open(os.path.join(path, "LOCK"), "a")
+            if fcntl is None:
+                return path, lock_file
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return path, lock_file
+            except BlockingIOError:
+                lock_file.close()
+
+    def _load_epoch(self) -> str:
+        """
+        Read the slot's epoch. A slot without journaled events starts a new
+        sequence space (seq restarts at 1), so it gets a fresh epoch.
+        """
+        path = os.path.join(self.path, EPOCH_FILE)
+        if self.segments and os.path.exists(path):
+            with open(path) as file:
+                epoch = file.read().strip()
+            if epoch:
+                return epoch
+
+        epoch = secrets.token_hex(4)
+        with open(path + ".tmp", "w") as file:
+            file.write(epoch)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(path + ".tmp", path)
+        return epoch
+
+    def _recover(self, path: str, first_seq: int) -> _Segment:
+        """Rebuild a segment's index and cut off a torn tail from a crash."""
+        segment = _Segment(path, first_seq)
+        size = os.path.getsize(path)
+        end = 0
+        if size:
+            with open(path, "rb") as file, mmap.mmap(file.fileno(), size, access=mmap.ACCESS_READ) as data:
+                for offset, seq, _, payload_end in _scan(data, 0, size):
+                    segment.size = offset
+                    segment.add(seq, payload_end - offset)
+                    end = payload_end
+        if end < size:
+            print(f"✗ Event journal: truncating {size - end} corrupt bytes in {path}")
+            os.truncate(path, end)
+        segment.flushed = end
+        return segment
+
+    def open(self) -> int:
+        """
+        Claim a slot, load its segments and epoch, and return the last
+        journaled seq. Called once at startup before any event is published.
+        """
+        self.path, self._lock_file = self._claim_slot()
+        names = sorted(name for name in os.listdir(self.path) if name.endswith(SEGMENT_SUFFIX))
+        self.segments = [
+            self._recover(os.path.join(self.path, name), int(name[:-len(SEGMENT_SUFFIX)]))
+            for name in names
+        ]
+        # Drop empty segments so seq ranges stay contiguous
+        for segment in [s for s in self.segments if s.count == 0]:
+            os.remove(segment.path)
+        self.segments = [s for s in self.segments if s.count]
+        self.epoch = self._load_epoch()
+        return self.last_seq
+
+    # ─────────────────────────────────────────────────────────────
+    # WRITE PATH
+    # ─────────────────────────────────────────────────────────────
+
+    def append(self, seq: int, message: dict):
+        """Buffer one event. It reaches the disk on the next group fsync."""
+        payload = json.dumps(message, separators=(",", ":")).encode()
+        record = HEADER.pack(len(payload), seq, zlib.crc32(payload)) + payload
+
+        segment = self.segments[-1] if self.segments else None
+        if segment is None or segment.size >= self.segment_bytes or seq != segment.last_seq + 1:
+            # Roll over (also when the seq space restarts, e.g. after wiping the database)
+            segment = _Segment(os.path.join(self.path, f"{seq:020d}{SEGMENT_SUFFIX}"), seq)
+            with self._segments_lock:
+                self.segments.append(segment)
+
+        segment.add(seq, len(record))
+        self._pending.append((segment, record))
+
+    def _write(self, batch: List[Tuple[_Segment, bytes]]):
+        """Write buffered records segment by segment, one fsync per file."""
+        for segment, records in itertools.groupby(batch, key=lambda item: item[0]):
+            data = b"".join(record for _, record in records)
+            if segment.file is None:
+                segment.file = open(segment.path, "ab")
+            segment.file.write(data)
+            segment.file.flush()
+            os.fsync(segment.file.fileno())
+            segment.flushed += len(data)
+
+        # Close files of segments that will not be written again
+        for segment in self.segments[:-1]:
+            if segment.file is not None and segment.flushed == segment.size:
+                segment.file.close()
+                segment.file = None
+
+    async def flush(self):
+        """Write and fsync everything appended so far."""
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, []
+            try:
+                await asyncio.to_thread(self._write, batch)
+            except Exception:
+                # Keep the records so they are retried on the next flush
+                self._pending = batch + self._pending
+                raise
+
+    async def _run_flush(self):
+        """Group fsync loop running for the lifetime of the app."""
+        while True:
+            await asyncio.sleep(self.fsync_interval)
+            try:
+                await self.flush()
+            except Exception as exc:
+                print(f"✗ Event journal flush failed: {exc}")
+
+    # ─────────────────────────────────────────────────────────────
+    # READ PATH
+    # ─────────────────────────────────────────────────────────────
+
+    def _map(self, segment: _Segment) -> Tuple[Optional[mmap.mmap], int]:
+        """Map the durable part of a segment. Sealed segments are mapped once."""
+        if segment.map is not None:
+            return segment.map, len(segment.map)
+
+        end = segment.flushed
+        if end == 0:
+            return None, 0
+        with open(segment.path, "rb") as file:
+            data = mmap.mmap(file.fileno(), end, access=mmap.ACCESS_READ)
+        if segment is not self.segments[-1] and end == segment.size:
+            segment.map = data
+        return data, end
+
+    def read_raw(self, after_seq: int = 0, until_seq: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Yield JSON payloads of durable events with after_seq < seq <= until_seq.
+        Blocking; run it in a thread (StreamingResponse does for sync iterators).
+        """
+        with self._segments_lock:
+            segments = [s for s in self.segments if s.last_seq > after_seq]
+
+        for segment in segments:
+            if until_seq is not None and segment.first_seq > until_seq:
+                return
+
+            data, end = self._map(segment)
+            if data is None:
+                continue
+
+            # Start from the last indexed record at or before the first wanted seq
+            position = bisect.bisect_right(segment.index_seqs, after_seq + 1) - 1
+            start = segment.index_offsets[position] if position >= 0 else 0
+
+            for _, seq, payload_start, payload_end in _scan(data, start, end):
+                if seq <= after_seq:
+                    continue
+                if until_seq is not None and seq > until_seq:
+                    return
+                yield data[payload_start:payload_end]
+
+    async def read_since(self, after_seq: int) -> Optional[List[dict]]:
+        """
+        Events after after_seq, for resuming clients.
+        Returns None if they are no longer journaled or exceed EVENT_JOURNAL_MAX_REPLAY.
+        """
+        if after_seq + 1 < self.first_seq or self.last_seq - after_seq > self.max_replay:
+            return None
+
+        # Make buffered events readable first
+        await self.flush()
+        until_seq = self.last_seq
+        payloads = await asyncio.to_thread(lambda: list(self.read_raw(after_seq, until_seq)))
+        if payloads and json.loads(payloads[0])["seq"] != after_seq + 1:
+            return None
+        return [json.loads(payload) for payload in payloads]
+
+    # ─────────────────────────────────────────────────────────────
+    # COMPACTION
+    # ─────────────────────────────────────────────────────────────
+
+    def compact(self) -> int:
+        """
+        Delete sealed segments past the retention age or size budget.
+        The active segment is never removed. Returns the number deleted.
+        """
+        now = time.time()
+        removed = []
+        with self._segments_lock:
+            total = sum(segment.size for segment in self.segments)
+            while len(self.segments) > 1:
+                oldest = self.segments[0]
+                expired = (
+                    self.retention_seconds
+                    and now - os.path.getmtime(oldest.path) > self.retention_seconds
+                )
+                oversized = self.max_bytes and total > self.max_bytes
+                if not (expired or oversized) or oldest.flushed != oldest.size:
+                    break
+                removed.append(self.segments.pop(0))
+                total -= oldest.size
+
+        for segment in removed:
+            # Readers still holding the map keep it alive until they finish
+            segment.map = None
+            os.remove(segment.path)
+        return len(removed)
+
+    async def _run_compaction(self):
+        """Compaction loop running for the lifetime of the app."""
+        while True:
+            await asyncio.sleep(self.compact_interval)
+            try:
+                removed = await asyncio.to_thread(self.compact)
+                if removed:
+                    print(f"✓ Event journal: removed {removed} old segments")
+            except Exception as exc:
+                print(f"✗ Event journal compaction failed: {exc}")
+
+    # ─────────────────────────────────────────────────────────────
+    # LIFECYCLE
+    # ─────────────────────────────────────────────────────────────
+
+    def start(self):
+        """Start the group fsync and compaction loops."""
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._run_flush()),
+                asyncio.create_task(self._run_compaction()),
+            ]
+
+    async def stop(self):
+        """Stop the loops, write remaining events and release the slot."""
+        for task in self._tasks:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+        await self.flush()
+        for segment in self.segments:
+            if segment.file is not None:
+                segment.file.close()
+                segment.file = None
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+
+# Single instance shared across the app
+event_journal = EventJournal()
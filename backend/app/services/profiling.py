@@ -0,0 +1,250 @@
+"""
+Profiling service.
+Opt-in per-request profiling: statistical stack samples and a SQL statement timeline.
+"""
+
+import itertools
+import random
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Deque, List, Optional
+
+from sqlalchemy import event
+
+from app.config import (
+    PROFILE_SAMPLE_RATE,
+    PROFILE_SLOW_MS,
+    PROFILE_STORE_SIZE,
+    PROFILE_SAMPLE_INTERVAL_MS,
+)
+from app.database import engine, read_engine
+from app.services.auth import verify_access_token
+
+
+# Per-request SQL timeline; copied into threadpool threads with the request context
+_current_sql: ContextVar[Optional[list]] = ContextVar("current_sql", default=None)
+
+MAX_SQL_STATEMENTS = 200
+MAX_STACK_DEPTH = 40
+
+# Leaf frames in these files are idle threads, not work
+IDLE_FILES = ("threading.py", "selectors.py", "queue.py", "thread.py")
+
+
+# ─────────────────────────────────────────────────────────────────
+# SQL TIMELINE
+# ─────────────────────────────────────────────────────────────────
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_sql.get() is not None:
+        context._profile_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    timeline = _current_sql.get()
+    started = getattr(context, "_profile_started", None)
+    if timeline is None or started is None or len(timeline) >= MAX_SQL_STATEMENTS:
+        return
+    timeline.append((started, time.perf_counter() - started, statement))
+
+
+def install_sql_listeners():
+    """Record SQL statements of profiled requests. Only called when profiling is enabled."""
+    engines = [engine] if read_engine is engine else [engine, read_engine]
+    for bind in engines:
+        event.listen(bind, "before_cursor_execute", _before_cursor_execute)
+        event.listen(bind, "after_cursor_execute", _after_cursor_execute)
+
+
+# ─────────────────────────────────────────────────────────────────
+# STACK SAMPLER
+# ─────────────────────────────────────────────────────────────────
+
+class StackSampler(threading.Thread):
+    """
+    Samples the stacks of all other threads at a fixed interval.
+
+    Statistical sampling covers both the event loop and threadpool
+    workers (where sync routes and bcrypt run), which cProfile cannot
+    do from the request's own thread. Concurrent requests show up too,
+    so profile on a quiet worker when precision matters.
+    """
+
+    def __init__(self, interval: float):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == self.ident:
+                    continue
+                if frame.f_code.co_filename.endswith(IDLE_FILES):
+                    continue
+
+                stack = []
+                while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                    code = frame.f_code
+                    stack.append(f"{code.co_filename.rsplit('/', 1)[-1]}:{code.co_name}:{frame.f_lineno}")
+                    frame = frame.f_back
+                self.samples[";".join(reversed(stack))] += 1
+
+    def stop(self) -> Counter:
+        self._stop_event.set()
+        self.join()
+        return self.samples
+
+
+# ─────────────────────────────────────────────────────────────────
+# PROFILE STORE
+# ─────────────────────────────────────────────────────────────────
+
+class ProfileStore:
+    """Keeps the most recent profiles in memory for the admin endpoint."""
+
+    def __init__(self, size: int = PROFILE_STORE_SIZE):
+        self.profiles: Deque[dict] = deque(maxlen=size)
+        self._ids = itertools.count(1)
+
+    def add(self, profile: dict) -> int:
+        profile["id"] = next(self._ids)
+        self.profiles.append(profile)
+        return profile["id"]
+
+    def list(self) -> List[dict]:
+        """Summaries, newest first."""
+        return [
+            {key: value for key, value in profile.items() if key not in ("sql", "stacks")}
+            for profile in reversed(self.profiles)
+        ]
+
+    def get(self, profile_id: int) -> Optional[dict]:
+        for profile in self.profiles:
+            if profile["id"] == profile_id:
+                return profile
+        return None
+
+
+# Single instance shared across the app
+profile_store = ProfileStore()
+
+
+# ─────────────────────────────────────────────────────────────────
+# MIDDLEWARE
+# ─────────────────────────────────────────────────────────────────
+
+def _is_admin(scope) -> bool:
+    """Check for a valid Bearer token in the request headers."""
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            value = value.decode("latin-1")
+            return value.startswith("Bearer ") and verify_access_token(value[7:]) is not None
+    return False
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware that profiles selected HTTP requests.
+
+    - Sampled: a PROFILE_SAMPLE_RATE fraction of requests, or requests
+      sent with "X-Profile: 1" and a valid admin token, get a full stack
+      sample profile plus SQL timeline.
+    - Slow: any other request slower than PROFILE_SLOW_MS is stored with
+      its SQL timeline (stack samples are only taken when chosen upfront).
+
+    Duration, stack samples and SQL cover the request up to the start of
+    the response, so long-lived streams (/events, /questions/export) are
+    not mistaken for slow requests and do not keep a sampler running.
+
+    Only installed when PROFILING_ENABLED is set, so it costs nothing otherwise.
+    """
+
+    def __init__(
+        self,
+        app,
+        sample_rate: float = PROFILE_SAMPLE_RATE,
+        slow_ms: float = PROFILE_SLOW_MS,
+        interval_ms: float = PROFILE_SAMPLE_INTERVAL_MS,
+    ):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
+        self.interval = interval_ms / 1000
+
+    def _reason(self, scope) -> Optional[str]:
+        """Why this request should get a stack profile, if at all."""
+        for name, value in scope["headers"]:
+            if name == b"x-profile" and value == b"1" and _is_admin(scope):
+                return "header"
+        if self.sample_rate and random.random() < self.sample_rate:
+            return "sample"
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        reason = self._reason(scope)
+        sampler = StackSampler(self.interval) if reason else None
+        timeline: list = []
+        # Filled in when the response starts; streaming bodies (SSE, exports) are not timed
+        response = {"status": None, "duration_ms": None, "sql_count": None, "samples": None}
+
+        def finish_timing():
+            if response["duration_ms"] is None:
+                response["duration_ms"] = (time.perf_counter() - started) * 1000
+                response["sql_count"] = len(timeline)
+                if sampler:
+                    response["samples"] = sampler.stop()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                finish_timing()
+            await send(message)
+
+        token = _current_sql.set(timeline)
+        started = time.perf_counter()
+        if sampler:
+            sampler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Also covers requests that failed before sending a response
+            finish_timing()
+            _current_sql.reset(token)
+            duration_ms = response["duration_ms"]
+            samples = response["samples"]
+            timeline = timeline[:response["sql_count"]]
+
+            if reason or duration_ms >= self.slow_ms:
+                sql_total_ms = sum(duration for _, duration, _ in timeline) * 1000
+                profile_store.add({
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": response["status"],
+                    "reason": reason or "slow",
+                    "started_at": datetime.utcnow().isoformat(),
+                    "duration_ms": round(duration_ms, 2),
+                    "sql_count": len(timeline),
+                    "sql_total_ms": round(sql_total_ms, 2),
+                    "sql": [
+                        {
+                            "offset_ms": round((at - started) * 1000, 2),
+                            "duration_ms": round(duration * 1000, 2),
+                            "statement": statement[:500],
+                        }
+                        for at, duration, statement in timeline
+                    ],
+                    "stacks": [
+                        {"stack": stack, "samples": count}
+                        for stack, count in samples.most_common(50)
+                    ] if samples is not None else None,
+                })
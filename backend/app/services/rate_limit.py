@@ -0,0 +1,163 @@
+"""
+Rate limiting service.
+Token-bucket rate limiting and concurrency admission for public write routes.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Tuple
+
+from app.config import (
+    RATE_LIMIT_PER_SECOND,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_REDIS_URL,
+    RATE_LIMIT_VOTES_PER_SECOND,
+    RATE_LIMIT_VOTES_BURST,
+    WRITE_MAX_CONCURRENCY,
+)
+
+
+# ─────────────────────────────────────────────────────────────────
+# TOKEN BUCKET RATE LIMITERS
+# ─────────────────────────────────────────────────────────────────
+
+class InMemoryRateLimiter:
+    """
+    Per-key token buckets kept in this process.
+
+    Each key gets `burst` tokens that refill at `rate` tokens per second.
+    Buckets are kept in least recently used order: buckets idle long enough
+    to be full again are dropped from the front, and once `max_keys` is
+    reached the least recently used bucket is evicted (it starts full next
+    time), so memory is bounded and each request does O(1) work amortized.
+    """
+
+    def __init__(self, rate: float, burst: int, max_keys: int = 100_000):
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self.buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()  # key -> (tokens, updated_at)
+
+    def _prune(self, now: float):
+        """Drop buckets that have refilled completely, then the oldest ones over max_keys."""
+        full_after = self.burst / self.rate
+        while self.buckets:
+            key, (_, updated_at) = next(iter(self.buckets.items()))
+            if now - updated_at < full_after:
+                break
+            del self.buckets[key]
+        while len(self.buckets) >= self.max_keys:
+            self.buckets.popitem(last=False)
+
+    async def hit(self, key: str) -> float:
+        """
+        Take one token for key.
+
+        Returns:
+            0 if the request is allowed, otherwise seconds until a token is free
+        """
+        now = time.monotonic()
+        tokens, updated_at = self.buckets.get(key, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - updated_at) * self.rate)
+
+        if key in self.buckets:
+            self.buckets.move_to_end(key)
+        else:
+            self._prune(now)
+
+        if tokens < 1:
+            self.buckets[key] = (tokens, now)
+            return (1 - tokens) / self.rate
+
+        self.buckets[key] = (tokens - 1, now)
+        return 0
+
+
+class RedisRateLimiter:
+    """
+    Token buckets shared by all workers through Redis.
+
+    The refill-and-take step runs as a Lua script so it is atomic across
+    workers. Requires the optional `redis` package.
+    """
+
+    SCRIPT = """
+    local rate = tonumber(ARGV[1])
+    local burst = tonumber(ARGV[2])
+    local now = tonumber(ARGV[3])
+    local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+    local tokens = tonumber(bucket[1]) or burst
+    local ts = tonumber(bucket[2]) or now
+    tokens = math.min(burst, tokens + (now - ts) * rate)
+    local wait = 0
+    if tokens < 1 then
+        wait = (1 - tokens) / rate
+    else
+        tokens = tokens - 1
+    end
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+    redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+    return tostring(wait)
+    """
+
+    def __init__(self, url: str, rate: float, burst: int, prefix: str = "ratelimit"):
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError:
+            raise RuntimeError("RATE_LIMIT_REDIS_URL is set but the 'redis' package is not installed")
+
+        self.rate = rate
+        self.burst = burst
+        self.prefix = prefix
+        self.client = redis_asyncio.from_url(url)
+        self.script = self.client.register_script(self.SCRIPT)
+
+    async def hit(self, key: str) -> float:
+        """Take one token for key. Returns 0 or seconds to wait."""
+        wait = await self.script(
+            keys=[f"{self.prefix}:{key}"],
+            args=[self.rate, self.burst, time.time()]
+        )
+        return float(wait)
+
+
+# ─────────────────────────────────────────────────────────────────
+# CONCURRENCY ADMISSION
+# ─────────────────────────────────────────────────────────────────
+
+class AdmissionController:
+    """
+    Caps how many write requests are in flight at once in this process.
+
+    Requests over the limit are rejected immediately instead of queueing,
+    so a burst cannot starve the event loop that serves WebSockets.
+    """
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max_concurrency
+        self.in_flight = 0
+
+    def try_acquire(self) -> bool:
+        """Reserve a slot. Returns False when the limit is reached."""
+        if self.max_concurrency and self.in_flight >= self.max_concurrency:
+            return False
+        self.in_flight += 1
+        return True
+
+    def release(self):
+        """Free a slot reserved by try_acquire."""
+        self.in_flight -= 1
+
+
+# Single instances shared across the app
+# Votes get their own buckets so voting never uses up a client's question quota
+if RATE_LIMIT_REDIS_URL:
+    rate_limiter = RedisRateLimiter(RATE_LIMIT_REDIS_URL, RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST)
+    vote_rate_limiter = RedisRateLimiter(
+        RATE_LIMIT_REDIS_URL, RATE_LIMIT_VOTES_PER_SECOND, RATE_LIMIT_VOTES_BURST, prefix="ratelimit:votes"
+    )
+else:
+    rate_limiter = InMemoryRateLimiter(RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST)
+    vote_rate_limiter = InMemoryRateLimiter(RATE_LIMIT_VOTES_PER_SECOND, RATE_LIMIT_VOTES_BURST)
+
+write_admission = AdmissionController(WRITE_MAX_CONCURRENCY)
@@ -0,0 +1,58 @@
+"""
+Read routing service.
+Decides whether a read may go to the replica or must see the client's own writes.
+"""
+
+import time
+from typing import Dict, Optional
+
+from app.config import READ_DATABASE_URL, REPLICA_LAG_WINDOW_SECONDS
+
+
+# Cookie carrying "read from primary until <unix time>" across workers
+PRIMARY_COOKIE = "qa_primary_until"
+
+
+class ReadRouter:
+    """
+    Tracks recent writers so they read their own writes.
+
+    After a write, the client's reads go to the primary for the lag
+    window. The deadline is remembered per client in this worker and
+    sent as a cookie, so other workers honour it too.
+    """
+
+    def __init__(self, enabled: bool, lag_window: float, max_clients: int = 100_000):
+        self.enabled = enabled
+        self.lag_window = lag_window
+        self.max_clients = max_clients
+        self.primary_until: Dict[str, float] = {}
+
+    def mark_write(self, client_key: str) -> float:
+        """Record a write by client. Returns the primary-read deadline (unix time)."""
+        now = time.time()
+        if len(self.primary_until) >= self.max_clients:
+            self.primary_until = {
+                key: until for key, until in self.primary_until.items() if until > now
+            }
+        until = now + self.lag_window
+        self.primary_until[client_key] = until
+        return until
+
+    def use_primary(self, client_key: str, cookie: Optional[str] = None) -> bool:
+        """Check whether this client's reads must go to the primary."""
+        if not self.enabled:
+            return True
+
+        now = time.time()
+        if self.primary_until.get(client_key, 0) > now:
+            return True
+
+        try:
+            return cookie is not None and float(cookie) > now
+        except ValueError:
+            return False
+
+
+# Single instance shared across the app
+read_router = ReadRouter(bool(READ_DATABASE_URL), REPLICA_LAG_WINDOW_SECONDS)
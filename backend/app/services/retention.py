@@ -0,0 +1,145 @@
+"""
+Retention service.
+Moves old answered questions from the live table into the archive.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import select, insert, delete
+
+from app.config import (
+    ARCHIVE_AFTER_DAYS,
+    ARCHIVE_BATCH_SIZE,
+    RETENTION_INTERVAL_SECONDS,
+)
+from app.database import SessionLocal
+from app.models.question import Question
+from app.models.archived_question import ArchivedQuestion
+from app.services.votes import vote_aggregator
+from app.services.websocket import manager
+
+
+# Columns copied from questions to archived_questions
+ARCHIVED_COLUMNS = [
+    "question_id",
+    "message",
+    "status",
+    "timestamp",
+    "answer",
+    "answered_by",
+    "answered_at",
+    "votes",
+]
+
+
+class RetentionJob:
+    """
+    Periodically archives answered questions older than a cutoff.
+
+    Rows are moved in batches, each batch in its own short transaction
+    (copy into archived_questions, then delete from questions), so the
+    live table is never locked for long. Each batch is announced with one
+    QUESTIONS_ARCHIVED event listing the moved ids, so clients drop them
+    from their feed without flooding event queues and history.
+    """
+
+    def __init__(
+        self,
+        archive_after_days: float = ARCHIVE_AFTER_DAYS,
+        batch_size: int = ARCHIVE_BATCH_SIZE,
+        interval: float = RETENTION_INTERVAL_SECONDS,
+    ):
+        self.archive_after = timedelta(days=archive_after_days)
+        self.batch_size = batch_size
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def archive_batch(self, cutoff: datetime) -> List[int]:
+        """Move one batch of questions answered before cutoff. Returns the moved ids."""
+        db = SessionLocal()
+        try:
+            eligible = (Question.status == "Answered", Question.answered_at < cutoff)
+            # Lock the picked rows (PostgreSQL) so they are not changed before they move
+            ids = db.scalars(
+                select(Question.question_id)
+                .where(*eligible)
+                .order_by(Question.answered_at)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            ).all()
+
+            if not ids:
+                return []
+
+            # Re-check eligibility in both statements: a question reopened since
+            # it was picked must stay live (SQLite has no row locks)
+            source = select(*[getattr(Question, name) for name in ARCHIVED_COLUMNS]).where(
+                Question.question_id.in_(ids), *eligible
+            )
+            db.execute(insert(ArchivedQuestion).from_select(ARCHIVED_COLUMNS, source))
+            moved = db.scalars(
+                delete(Question)
+                .where(Question.question_id.in_(ids), *eligible)
+                .returning(Question.question_id)
+            ).all()
+            db.commit()
+            return list(moved)
+        finally:
+            db.close()
+
+    async def _announce(self, ids: List[int]):
+        """Tell clients the archived questions left the feed."""
+        if not ids:
+            return
+        for question_id in ids:
+            vote_aggregator.discard(question_id)
+        await manager.broadcast({
+            "type": "QUESTIONS_ARCHIVED",
+            "data": {
+                "question_ids": ids
+            }
+        })
+
+    async def archive_all(self) -> int:
+        """Archive every eligible question, batch by batch. Returns rows moved."""
+        cutoff = datetime.utcnow() - self.archive_after
+        total = 0
+
+        while True:
+            ids = await asyncio.to_thread(self.archive_batch, cutoff)
+            await self._announce(ids)
+            total += len(ids)
+            if len(ids) < self.batch_size:
+                return total
+
+    async def _run(self):
+        """Retention loop running for the lifetime of the app."""
+        while True:
+            try:
+                moved = await self.archive_all()
+                if moved:
+                    print(f"✓ Archived {moved} answered questions")
+            except Exception as exc:
+                print(f"✗ Retention run failed: {exc}")
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        """Start the background retention loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the retention loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# Single instance shared across the app
+retention_job = RetentionJob()
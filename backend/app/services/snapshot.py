@@ -0,0 +1,83 @@
+"""
+Snapshot service.
+Keeps a pre-encoded first page of the feed for WebSocket clients to receive on connect.
+"""
+
+import asyncio
+from typing import Dict, Optional, Tuple, Union
+
+from app.config import SNAPSHOT_PAGE_SIZE
+from app.database import SessionLocal
+from app.schemas.question import QuestionResponse
+from app.services.encoding import JSON, encode
+from app.services.feed import get_feed_page
+from app.services.websocket import manager
+
+
+class FeedSnapshot:
+    """
+    Shared, pre-encoded SNAPSHOT message.
+
+    The snapshot is encoded once per encoding (JSON / MessagePack) and
+    rebuilt lazily, only when a feed event has been
+    broadcast since the last build (manager.feed_version changed). A
+    single lock makes a reconnect storm trigger one query; every other
+    client gets the same encoded text.
+
+    The snapshot's "seq" is the event sequence at build time. Events with
+    a higher seq may or may not be reflected, so clients apply them on top
+    (all feed events are idempotent by question_id).
+    """
+
+    def __init__(self, page_size: int = SNAPSHOT_PAGE_SIZE):
+        self.page_size = page_size
+        self._message: Optional[dict] = None
+        self._encoded: Dict[str, Union[str, bytes]] = {}
+        self._seq = 0
+        self._feed_version = -1
+        self._lock = asyncio.Lock()
+
+    def _build(self, seq: int) -> dict:
+        """Query the first page and build the SNAPSHOT message."""
+        db = SessionLocal()
+        try:
+            page = get_feed_page(db, self.page_size)
+            return {
+                "type": "SNAPSHOT",
+                "data": {
+                    "questions": [
+                        QuestionResponse.model_validate(question).model_dump(mode="json")
+                        for question in page["questions"]
+                    ],
+                    "next_cursor": page["next_cursor"],
+                    "has_more": page["has_more"]
+                },
+                "seq": seq,
+                "epoch": manager.epoch
+            }
+        finally:
+            db.close()
+
+    def invalidate(self):
+        """Force a rebuild on the next get()."""
+        self._feed_version = -1
+
+    async def get(self, encoding: str = JSON) -> Tuple[Union[str, bytes], int]:
+        """Return (encoded SNAPSHOT message, seq it was built at)."""
+        if self._feed_version != manager.feed_version:
+            async with self._lock:
+                # Another client may have rebuilt it while we waited
+                if self._feed_version != manager.feed_version:
+                    feed_version, seq = manager.feed_version, manager.sequence
+                    self._message = await asyncio.to_thread(self._build, seq)
+                    self._encoded = {}
+                    self._seq = seq
+                    self._feed_version = feed_version
+
+        if encoding not in self._encoded:
+            self._encoded[encoding] = encode(self._message, encoding)
+        return self._encoded[encoding], self._seq
+
+
+# Single instance shared across the app
+feed_snapshot = FeedSnapshot()
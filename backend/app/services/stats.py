@@ -0,0 +1,177 @@
+"""
+Statistics service.
+Keeps dashboard statistics up to date incrementally instead of querying on every refresh.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy import extract, func, select, union_all
+
+from app.config import STATS_BROADCAST_INTERVAL_SECONDS, STATS_RESYNC_SECONDS
+from app.database import SessionLocal, engine
+from app.models.question import Question
+from app.models.archived_question import ArchivedQuestion
+from app.services.websocket import manager
+
+
+STATUSES = ["Pending", "Escalated", "Answered"]
+
+
+def _answer_seconds(model, dialect: str):
+    """SQL expression for seconds between timestamp and answered_at."""
+    if dialect == "sqlite":
+        return (func.julianday(model.answered_at) - func.julianday(model.timestamp)) * 86400
+    return extract("epoch", model.answered_at - model.timestamp)
+
+
+class QuestionStats:
+    """
+    Counters for the stats endpoint.
+
+    Handlers call the question_* hooks after each commit, so reading the
+    stats is O(1). Counters are rebuilt from the database on startup
+    (questions and archived_questions, so retention does not change them)
+    and optionally re-synced periodically to absorb writes made by other
+    workers. Changes are broadcast as STATS_UPDATED at most once per
+    broadcast interval.
+    """
+
+    def __init__(
+        self,
+        broadcast_interval: float = STATS_BROADCAST_INTERVAL_SECONDS,
+        resync_interval: float = STATS_RESYNC_SECONDS,
+    ):
+        self.broadcast_interval = broadcast_interval
+        self.resync_interval = resync_interval
+        self.counts: Dict[str, int] = {status: 0 for status in STATUSES}
+        self.answered_seconds_total = 0.0
+        self.answered_with_time = 0
+        self._dirty = False
+        self._task: Optional[asyncio.Task] = None
+
+    # ─────────────────────────────────────────────────────────────
+    # REBUILD
+    # ─────────────────────────────────────────────────────────────
+
+    def rebuild(self):
+        """Recompute all counters from the database."""
+        dialect = engine.dialect.name
+        rows = union_all(*[
+            select(
+                model.status.label("status"),
+                model.answered_at.label("answered_at"),
+                _answer_seconds(model, dialect).label("answer_seconds"),
+            )
+            for model in (Question, ArchivedQuestion)
+        ]).subquery()
+
+        db = SessionLocal()
+        try:
+            counts = {status: 0 for status in STATUSES}
+            for status, count in db.execute(
+                select(rows.c.status, func.count()).group_by(rows.c.status)
+            ):
+                counts[status] = count
+
+            total, answered = db.execute(
+                select(func.sum(rows.c.answer_seconds), func.count())
+                .where(rows.c.status == "Answered", rows.c.answered_at.isnot(None))
+            ).one()
+        finally:
+            db.close()
+
+        self.counts = counts
+        self.answered_seconds_total = float(total or 0)
+        self.answered_with_time = answered
+        self._dirty = True
+
+    # ─────────────────────────────────────────────────────────────
+    # INCREMENTAL UPDATES
+    # ─────────────────────────────────────────────────────────────
+
+    def _add(self, status: str, timestamp: Optional[datetime], answered_at: Optional[datetime], sign: int):
+        """Add (sign=1) or remove (sign=-1) one question's contribution."""
+        self.counts[status] = self.counts.get(status, 0) + sign
+        if status == "Answered" and timestamp and answered_at:
+            self.answered_seconds_total += sign * (answered_at - timestamp).total_seconds()
+            self.answered_with_time += sign
+        self._dirty = True
+
+    def question_created(self, status: str = "Pending"):
+        """Record a newly created question."""
+        self._add(status, None, None, 1)
+
+    def question_changed(
+        self,
+        old_status: str,
+        old_answered_at: Optional[datetime],
+        new_status: str,
+        new_answered_at: Optional[datetime],
+        timestamp: Optional[datetime],
+    ):
+        """Record a status change (including re-marking as Answered)."""
+        self._add(old_status, timestamp, old_answered_at, -1)
+        self._add(new_status, timestamp, new_answered_at, 1)
+
+    def question_deleted(self, status: str, timestamp: Optional[datetime], answered_at: Optional[datetime]):
+        """Record a deleted question."""
+        self._add(status, timestamp, answered_at, -1)
+
+    # ─────────────────────────────────────────────────────────────
+    # READ / BROADCAST
+    # ─────────────────────────────────────────────────────────────
+
+    def snapshot(self) -> dict:
+        """Current stats in the STATS_UPDATED / endpoint shape."""
+        mean = (
+            self.answered_seconds_total / self.answered_with_time
+            if self.answered_with_time else None
+        )
+        return {
+            "counts": dict(self.counts),
+            "total": sum(self.counts.values()),
+            "unanswered": self.counts.get("Pending", 0) + self.counts.get("Escalated", 0),
+            "mean_time_to_answer_seconds": round(mean, 1) if mean is not None else None,
+        }
+
+    async def _run(self):
+        """Broadcast changes at a throttled rate and re-sync periodically."""
+        loop = asyncio.get_running_loop()
+        next_resync = loop.time() + self.resync_interval
+
+        while True:
+            await asyncio.sleep(self.broadcast_interval)
+            try:
+                if self.resync_interval and loop.time() >= next_resync:
+                    await asyncio.to_thread(self.rebuild)
+                    next_resync = loop.time() + self.resync_interval
+
+                if self._dirty:
+                    self._dirty = False
+                    await manager.broadcast({
+                        "type": "STATS_UPDATED",
+                        "data": self.snapshot()
+                    })
+            except Exception as exc:
+                print(f"✗ Stats update failed: {exc}")
+
+    def start(self):
+        """Start the background broadcast loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the background broadcast loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# Single instance shared across the app
+question_stats = QuestionStats()
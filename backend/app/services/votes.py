@@ -0,0 +1,111 @@
+"""
+Vote aggregation service.
+Absorbs upvotes in memory and flushes them to the database in batches.
+"""
+
+import asyncio
+from typing import Dict, List, Optional
+
+from sqlalchemy import update
+
+from app.config import VOTE_FLUSH_INTERVAL_SECONDS
+from app.database import SessionLocal
+from app.models.question import Question
+from app.services.websocket import manager
+from app.services.work_queue import moderator_queue
+
+
+class VoteAggregator:
+    """
+    Collects vote deltas per question and applies them periodically.
+
+    Each click only bumps a counter in a dict. A background task swaps
+    the dict out every flush interval, writes all deltas in a single
+    transaction and broadcasts one VOTES_UPDATED event with the new
+    totals, so load is bounded by the interval rather than the click rate.
+    """
+
+    def __init__(self, flush_interval: float = VOTE_FLUSH_INTERVAL_SECONDS):
+        self.flush_interval = flush_interval
+        self.pending: Dict[int, int] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def add_vote(self, question_id: int, delta: int = 1) -> int:
+        """Queue a vote delta. Returns the pending delta for the question."""
+        self.pending[question_id] = self.pending.get(question_id, 0) + delta
+        return self.pending[question_id]
+
+    def discard(self, question_id: int):
+        """Drop pending votes for a question (e.g. after it was deleted)."""
+        self.pending.pop(question_id, None)
+
+    def _write(self, deltas: Dict[int, int]) -> List[dict]:
+        """Apply deltas in one transaction and return the new totals."""
+        db = SessionLocal()
+        try:
+            for question_id, delta in deltas.items():
+                db.execute(
+                    update(Question)
+                    .where(Question.question_id == question_id)
+                    .values(votes=Question.votes + delta)
+                )
+            db.commit()
+
+            rows = db.query(Question.question_id, Question.votes).filter(
+                Question.question_id.in_(list(deltas))
+            ).all()
+            return [{"question_id": row.question_id, "votes": row.votes} for row in rows]
+        finally:
+            db.close()
+
+    async def flush(self):
+        """Write pending deltas to the database and broadcast new totals."""
+        if not self.pending:
+            return
+
+        # Swap the buffer so votes arriving during the write go to the next batch
+        deltas, self.pending = self.pending, {}
+
+        try:
+            totals = await asyncio.to_thread(self._write, deltas)
+        except Exception:
+            # Put the deltas back so they are retried on the next flush
+            for question_id, delta in deltas.items():
+                self.add_vote(question_id, delta)
+            raise
+
+        if totals:
+            moderator_queue.update_votes(totals)
+            await manager.broadcast({
+                "type": "VOTES_UPDATED",
+                "data": {"votes": totals}
+            })
+
+    async def _run(self):
+        """Flush loop running for the lifetime of the app."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as exc:
+                print(f"✗ Vote flush failed: {exc}")
+
+    def start(self):
+        """Start the background flush loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the flush loop and write any remaining votes."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+# Single instance shared across the app
+vote_aggregator = VoteAggregator()
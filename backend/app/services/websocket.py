@@ -3,34 +3,242 @@ WebSocket service.
 Manages WebSocket connections and broadcasts messages to all clients.
 """
 
+import asyncio
+import json
+import secrets
+from collections import deque
 from fastapi import WebSocket
-from typing import List
+from typing import Deque, Dict, List, Optional, Set, Tuple, Union
+
+from app.config import EVENT_HISTORY_SIZE, SSE_QUEUE_SIZE
+from app.services.encoding import JSON, encode
+
+
+# Events that change the contents or order of the question feed
+FEED_EVENTS = {
+    "NEW_QUESTION",
+    "QUESTION_ANSWERED",
+    "QUESTION_UPDATED",
+    "QUESTION_DELETED",
+    "QUESTIONS_ARCHIVED",
+    "VOTES_UPDATED",
+}
+
+# Every event type clients can subscribe to
+EVENT_TYPES = FEED_EVENTS | {"STATS_UPDATED"}
+
+
+def parse_event_id(value: str) -> Optional[Tuple[Optional[str], int]]:
+    """
+    Parse an SSE event id ("<epoch>-<seq>", or a bare seq from older clients).
+    Returns (epoch, seq), or None if the id is malformed.
+    """
+    epoch, _, seq = value.rpartition("-")
+    if not seq.isdigit():
+        return None
+    return (epoch or None), int(seq)
 
 
 class ConnectionManager:
     """
-    Manages active WebSocket connections.
+    Manages active WebSocket connections and Server-Sent Events streams.
     Allows broadcasting messages to all connected clients.
+
+    Every broadcast message is stamped with an increasing "seq" number and
+    the "epoch" of this sequence space, and kept in a bounded history so
+    clients can resume after a reconnect.
+    feed_version changes only on FEED_EVENTS, so cached views of the feed
+    know when they are stale.
+
+    With an event journal attached, every message is also appended to
+    disk and resumes older than the history are replayed from it. With
+    broadcast shards attached, every message is also handed to them.
     """
-    
-    def __init__(self):
+
+    def __init__(self, history_size: int = EVENT_HISTORY_SIZE):
         self.active_connections: List[WebSocket] = []
-    
+        self.sse_subscribers: Set[asyncio.Queue] = set()
+        self.sequence = 0
+        # Names this process's sequence space; seq numbers restart with it.
+        # Taken from the journal slot when one is attached, so it survives restarts
+        self.epoch = secrets.token_hex(4)
+        self.feed_version = 0
+        self.history: Deque[Tuple[int, dict]] = deque(maxlen=history_size)
+        self.journal = None
+        self.shards = None
+
     async def connect(self, websocket: WebSocket):
         """Accept and store a new WebSocket connection."""
         await websocket.accept()
         self.active_connections.append(websocket)
-    
+
+    def register(self, websocket: WebSocket):
+        """Store an already accepted WebSocket connection."""
+        self.active_connections.append(websocket)
+
     def disconnect(self, websocket: WebSocket):
         """Remove a WebSocket connection."""
         if websocket in self.active_connections:
             self.active_connections.remove(websocket)
-    
+
+    async def close_all(self, code: int = 1001, reason: str = "Server shutting down"):
+        """
+        Close every connection with a close frame and end all SSE streams.
+        Used on graceful shutdown so clients reconnect to another worker.
+        """
+        connections, self.active_connections = self.active_connections, []
+        for connection in connections:
+            try:
+                await connection.close(code=code, reason=reason)
+            except:
+                # Already gone
+                pass
+
+        for queue in list(self.sse_subscribers):
+            self.sse_subscribers.discard(queue)
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(None)
+
+    def subscribe_sse(self) -> asyncio.Queue:
+        """Register an SSE stream. Encoded frames are pushed to the returned queue."""
+        queue = asyncio.Queue(maxsize=SSE_QUEUE_SIZE)
+        self.sse_subscribers.add(queue)
+        return queue
+
+    def unsubscribe_sse(self, queue: asyncio.Queue):
+        """Remove an SSE stream."""
+        self.sse_subscribers.discard(queue)
+
+    def resumable(self, seq: int, epoch: Optional[str] = None) -> bool:
+        """
+        Check that seq belongs to this sequence space: same epoch (when the
+        client sent one) and not ahead of the counter. Ids from another
+        process or an earlier run fail this and need a resync.
+        """
+        return (epoch is None or epoch == self.epoch) and seq <= self.sequence
+
+    def events_since(self, seq: int, epoch: Optional[str] = None) -> Optional[List[dict]]:
+        """
+        Return buffered messages with a sequence number greater than seq.
+        Returns None if some of them have already fallen out of the history,
+        or if seq is not from this sequence space (see resumable).
+        """
+        if not self.resumable(seq, epoch):
+            return None
+        if seq == self.sequence:
+            return []
+        if not self.history or self.history[0][0] > seq + 1:
+            return None
+        return [message for message_seq, message in self.history if message_seq > seq]
+
+    def attach_journal(self, journal):
+        """
+        Journal every message and continue the journal's sequence space:
+        numbering resumes after the last journaled event, under its epoch.
+        """
+        self.journal = journal
+        self.sequence = max(self.sequence, journal.last_seq)
+        self.epoch = journal.epoch
+
+    def attach_shards(self, shards):
+        """Also publish every message to the broadcast shards."""
+        self.shards = shards
+
+    async def replay_since(self, seq: int, epoch: Optional[str] = None) -> Optional[List[dict]]:
+        """
+        Like events_since, but falls back to the event journal for events
+        that have left the in-memory history.
+        """
+        if not self.resumable(seq, epoch):
+            return None
+
+        missed = self.events_since(seq)
+        if missed is not None or self.journal is None:
+            return missed
+
+        journaled = await self.journal.read_since(seq)
+        if journaled is None:
+            return None
+
+        # Events published while reading are in the history
+        newer = self.events_since(journaled[-1]["seq"] if journaled else seq)
+        if newer is None:
+            return None
+        return journaled + newer
+
+    @staticmethod
+    def encode_sse(message: dict) -> str:
+        """Encode a message as a Server-Sent Events frame."""
+        return f"id: {message['epoch']}-{message['seq']}\nevent: {message['type']}\ndata: {json.dumps(message)}\n\n"
+
+    def _publish(self, message: dict) -> dict:
+        """Stamp a message with the next sequence number and fan it out to SSE streams."""
+        self.sequence += 1
+        if message["type"] in FEED_EVENTS:
+            self.feed_version += 1
+        message = {**message, "seq": self.sequence, "epoch": self.epoch}
+        self.history.append((self.sequence, message))
+        if self.journal is not None:
+            self.journal.append(self.sequence, message)
+        if self.shards is not None:
+            self.shards.publish(message)
+
+        # Encode once, share the frame with every SSE stream
+        frame = self.encode_sse(message)
+        for queue in list(self.sse_subscribers):
+            try:
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                # Slow consumer: end its stream, it will resume via Last-Event-ID
+                self.sse_subscribers.discard(queue)
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+
+        return message
+
+    @staticmethod
+    def wants(websocket: WebSocket, message_type: str) -> bool:
+        """Check the connection's subscription filter (None means all events)."""
+        events = getattr(websocket.state, "events", None)
+        return events is None or message_type in events
+
+    @staticmethod
+    async def send_encoded(websocket: WebSocket, payload: Union[str, bytes]):
+        """Send an already encoded message as a text or binary frame."""
+        if isinstance(payload, bytes):
+            await websocket.send_bytes(payload)
+        else:
+            await websocket.send_text(payload)
+
+    async def send(self, websocket: WebSocket, message: dict):
+        """Encode a message for one connection and send it."""
+        encoding = getattr(websocket.state, "encoding", JSON)
+        await self.send_encoded(websocket, encode(message, encoding))
+
     async def broadcast(self, message: dict):
         """Send a message to all connected clients."""
+        await self.broadcast_many([message])
+
+    async def broadcast_many(self, messages: List[dict]):
+        """
+        Send a batch of messages to all clients in a single pass.
+        Each message is encoded at most once per encoding in use.
+        """
+        published = [self._publish(message) for message in messages]
+        encoded: Dict[Tuple[int, str], Union[str, bytes]] = {}
+
         for connection in self.active_connections:
+            encoding = getattr(connection.state, "encoding", JSON)
             try:
-                await connection.send_json(message)
+                for index, message in enumerate(published):
+                    if not self.wants(connection, message["type"]):
+                        continue
+                    key = (index, encoding)
+                    if key not in encoded:
+                        encoded[key] = encode(message, encoding)
+                    await self.send_encoded(connection, encoded[key])
             except:
                 # Client disconnected, will be cleaned up on next message
                 pass
@@ -38,4 +246,3 @@ class ConnectionManager:
 
 # Single instance shared across the app
 manager = ConnectionManager()
-
@@ -0,0 +1,220 @@
+"""
+Moderator work queue service.
+In-memory priority index of open questions with claim/lease semantics.
+"""
+
+import asyncio
+import heapq
+import itertools
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import or_, update
+
+from app.config import QUEUE_LEASE_SECONDS
+from app.database import SessionLocal
+from app.models.question import Question
+
+
+# Lower rank is handled first; Answered questions are not queued
+STATUS_RANK = {"Escalated": 1, "Pending": 2}
+
+
+class ModeratorQueue:
+    """
+    Priority queue of open questions for the "next question" button.
+
+    Order: Escalated before Pending, then most votes, then oldest, then
+    question_id. Backed by a binary heap with lazy invalidation: every
+    change pushes a new versioned entry and stale ones are skipped on pop,
+    so create/update/claim are O(log n).
+
+    A claim leases the question to one moderator. The lease is taken with
+    a compare-and-set on the question row, so moderators on different
+    workers cannot claim the same question; expired leases return the
+    question to the queue.
+    """
+
+    def __init__(self, lease_seconds: float = QUEUE_LEASE_SECONDS):
+        self.lease = timedelta(seconds=lease_seconds)
+        self._heap: List[tuple] = []  # (key, version, question_id)
+        self._entries: Dict[int, Tuple[tuple, int]] = {}  # question_id -> (key, version)
+        self._leases: Dict[int, Tuple[int, datetime]] = {}  # question_id -> (moderator_id, expires_at)
+        self._lease_heap: List[Tuple[datetime, int]] = []  # (expires_at, question_id)
+        self._versions = itertools.count()
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ─────────────────────────────────────────────────────────────
+    # INDEX MAINTENANCE (called by the question handlers)
+    # ─────────────────────────────────────────────────────────────
+
+    def _push(self, question_id: int, key: tuple):
+        version = next(self._versions)
+        self._entries[question_id] = (key, version)
+        if question_id not in self._leases:
+            heapq.heappush(self._heap, (key, version, question_id))
+
+        # Drop stale entries once they outnumber live ones
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [
+                (key, version, qid) for qid, (key, version) in self._entries.items()
+                if qid not in self._leases
+            ]
+            heapq.heapify(self._heap)
+
+    def upsert(self, question_id: int, status: str, votes: int, timestamp: Optional[datetime]):
+        """Add or re-rank a question; Answered questions are removed."""
+        if status not in STATUS_RANK:
+            self.remove(question_id)
+            return
+        key = (STATUS_RANK[status], -(votes or 0), timestamp or datetime.min, question_id)
+        self._push(question_id, key)
+
+    def update_votes(self, totals: Iterable[dict]):
+        """Re-rank queued questions after a vote flush."""
+        for total in totals:
+            entry = self._entries.get(total["question_id"])
+            if entry:
+                rank, _, timestamp, question_id = entry[0]
+                self._push(question_id, (rank, -total["votes"], timestamp, question_id))
+
+    def remove(self, question_id: int):
+        """Drop a question (answered, deleted or archived)."""
+        self._entries.pop(question_id, None)
+        self._leases.pop(question_id, None)
+
+    def rebuild(self):
+        """Load all open questions from the database."""
+        db = SessionLocal()
+        try:
+            rows = db.query(
+                Question.question_id, Question.status, Question.votes, Question.timestamp
+            ).filter(Question.status.in_(list(STATUS_RANK))).all()
+        finally:
+            db.close()
+
+        self._heap, self._entries = [], {}
+        self._leases, self._lease_heap = {}, []
+        for row in rows:
+            self.upsert(row.question_id, row.status, row.votes, row.timestamp)
+
+    # ─────────────────────────────────────────────────────────────
+    # CLAIM / RELEASE
+    # ─────────────────────────────────────────────────────────────
+
+    def _expire_leases(self, now: datetime):
+        """Return questions with expired leases to the queue."""
+        while self._lease_heap and self._lease_heap[0][0] <= now:
+            expires_at, question_id = heapq.heappop(self._lease_heap)
+            lease = self._leases.get(question_id)
+            if lease and lease[1] == expires_at:
+                del self._leases[question_id]
+                entry = self._entries.get(question_id)
+                if entry:
+                    heapq.heappush(self._heap, (entry[0], entry[1], question_id))
+
+    def _pop_ready(self) -> Optional[int]:
+        """Pop the best question that is not leased."""
+        while self._heap:
+            key, version, question_id = heapq.heappop(self._heap)
+            entry = self._entries.get(question_id)
+            if entry and entry[1] == version and question_id not in self._leases:
+                return question_id
+        return None
+
+    def _set_lease(self, question_id: int, moderator_id: int, expires_at: datetime):
+        self._leases[question_id] = (moderator_id, expires_at)
+        heapq.heappush(self._lease_heap, (expires_at, question_id))
+
+    def _lease_in_db(self, question_id: int, moderator_id: int, now: datetime, expires_at: datetime):
+        """
+        Compare-and-set the lease on the question row.
+
+        Returns:
+            ("ok", expires_at), ("held", other lease expiry) or ("gone", None)
+        """
+        db = SessionLocal()
+        try:
+            result = db.execute(
+                update(Question)
+                .where(
+                    Question.question_id == question_id,
+                    Question.status != "Answered",
+                    or_(
+                        Question.claim_expires_at.is_(None),
+                        Question.claim_expires_at <= now,
+                        Question.claimed_by == moderator_id,
+                    )
+                )
+                .values(claimed_by=moderator_id, claim_expires_at=expires_at)
+            )
+            db.commit()
+            if result.rowcount == 1:
+                return "ok", expires_at
+
+            row = db.query(Question.status, Question.claim_expires_at).filter(
+                Question.question_id == question_id
+            ).first()
+            if row is None or row.status == "Answered":
+                return "gone", None
+            return "held", row.claim_expires_at
+        finally:
+            db.close()
+
+    async def claim(self, moderator_id: int) -> Optional[Tuple[int, datetime]]:
+        """
+        Lease the highest priority open question to a moderator.
+
+        Returns:
+            (question_id, lease expiry) or None if nothing is available
+        """
+        async with self._lock:
+            while True:
+                now = datetime.utcnow()
+                self._expire_leases(now)
+
+                question_id = self._pop_ready()
+                if question_id is None:
+                    return None
+
+                result, expires_at = await asyncio.to_thread(
+                    self._lease_in_db, question_id, moderator_id, now, now + self.lease
+                )
+                if result == "ok":
+                    self._set_lease(question_id, moderator_id, expires_at)
+                    return question_id, expires_at
+                if result == "gone":
+                    self.remove(question_id)
+                else:
+                    # Claimed through another worker, skip it until that lease ends
+                    self._set_lease(question_id, -1, expires_at)
+
+    def _release_in_db(self, question_id: int, moderator_id: int) -> bool:
+        db = SessionLocal()
+        try:
+            result = db.execute(
+                update(Question)
+                .where(Question.question_id == question_id, Question.claimed_by == moderator_id)
+                .values(claimed_by=None, claim_expires_at=None)
+            )
+            db.commit()
+            return result.rowcount == 1
+        finally:
+            db.close()
+
+    async def release(self, question_id: int, moderator_id: int) -> bool:
+        """Give a claimed question back to the queue. Returns False if not held by moderator."""
+        released = await asyncio.to_thread(self._release_in_db, question_id, moderator_id)
+        if released:
+            lease = self._leases.pop(question_id, None)
+            entry = self._entries.get(question_id)
+            if lease and entry:
+                heapq.heappush(self._heap, (entry[0], entry[1], question_id))
+        return released
+
+
+# Single instance shared across the app
+moderator_queue = ModeratorQueue()
@@ -0,0 +1,4 @@
+"""
+Benchmarks package.
+Standalone load and latency scripts, run with: python -m benchmarks.<name>
+"""
@@ -0,0 +1,86 @@
+"""
+Cold start benchmark.
+Measures time from process spawn to the first served request.
+
+For each mode, starts uvicorn several times against the same SQLite
+database (created once up front) and records:
+- ready:  first 200 from /health/ready
+- first:  first 200 from GET /questions/ after that
+
+Usage (from backend/):
+    python -m benchmarks.cold_start --runs 5
+
+Requires httpx.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+
+MODES = {
+    "create_all": {"AUTO_CREATE_TABLES": "true"},
+    "skip_schema": {"AUTO_CREATE_TABLES": "false"},
+}
+
+
+def cold_start(port: int, env: dict) -> tuple:
+    """Spawn one server and return (seconds to ready, seconds to first feed page)."""
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env={**os.environ, **env},
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=1) as client:
+            while True:
+                try:
+                    if client.get("/health/ready").status_code == 200:
+                        break
+                except httpx.HTTPError:
+                    pass
+                if time.perf_counter() - started > 30:
+                    raise RuntimeError("Server did not become ready")
+                time.sleep(0.01)
+            ready = time.perf_counter() - started
+
+            client.get("/questions/").raise_for_status()
+            first = time.perf_counter() - started
+        return ready, first
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base_env = {"DATABASE_URL": f"sqlite:///{os.path.join(tmp, 'bench.db')}"}
+
+        # First boot creates the schema so every measured run starts from the same state
+        cold_start(args.port, {**base_env, **MODES["create_all"]})
+
+        for mode, mode_env in MODES.items():
+            results = [cold_start(args.port, {**base_env, **mode_env}) for _ in range(args.runs)]
+            ready = [r[0] * 1000 for r in results]
+            first = [r[1] * 1000 for r in results]
+            print(
+                f"{mode:>11}: ready median {statistics.median(ready):.0f} ms | "
+                f"first request median {statistics.median(first):.0f} ms | "
+                f"runs={args.runs}"
+            )
+
+
+if __name__ == "__main__":
+    main()
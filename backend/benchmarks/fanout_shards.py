@@ -0,0 +1,116 @@
+"""
+Broadcast shard benchmark.
+Measures fan-out throughput (frames delivered per second) as the number
+of broadcast shards grows.
+
+For each shard count, starts BroadcastShards on a free port, connects
+--clients WebSocket clients from several client processes, publishes
+--events events as fast as they are accepted and waits until every
+client has received all of them. Clients need CPU too, so run it on a
+box with more cores than shards.
+
+Usage (from backend/):
+    python -m benchmarks.fanout_shards --shards 1,2,4 --clients 1000 --events 200
+    python -m benchmarks.fanout_shards --mode thread
+
+Linux only (SO_REUSEPORT).
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import socket
+import time
+
+from websockets.asyncio.client import connect
+
+from app.services.broadcast_shards import BroadcastShards
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def run_clients(port: int, connections: int, events: int, connected, results):
+    """Client process: open connections, report when every one has all events."""
+    async def main():
+        sockets = [await connect(f"ws://127.0.0.1:{port}", max_queue=None) for _ in range(connections)]
+        connected.release()
+
+        async def receive(websocket):
+            for _ in range(events):
+                await websocket.recv()
+
+        await asyncio.gather(*[receive(websocket) for websocket in sockets])
+        results.put(time.time())
+        for websocket in sockets:
+            await websocket.close()
+
+    asyncio.run(main())
+
+
+async def measure(shards: int, mode: str, clients: int, events: int, client_processes: int) -> dict:
+    """Deliveries per second with this many shards."""
+    port = free_port()
+    broadcaster = BroadcastShards(shards=shards, mode=mode, host="127.0.0.1", port=port)
+    await broadcaster.start()
+
+    context = multiprocessing.get_context("spawn")
+    connected = context.Semaphore(0)
+    results = context.Queue()
+    per_process = clients // client_processes
+    processes = [
+        context.Process(target=run_clients, args=(port, per_process, events, connected, results))
+        for _ in range(client_processes)
+    ]
+    try:
+        for process in processes:
+            process.start()
+        for _ in processes:
+            await asyncio.to_thread(connected.acquire)
+
+        payload = {"question_id": 0, "message": "x" * 120, "status": "Pending", "votes": 0}
+        started = time.time()
+        for seq in range(1, events + 1):
+            broadcaster.publish({"type": "NEW_QUESTION", "data": payload, "seq": seq})
+            # Let pipe writes and shard wake-ups run between events
+            await asyncio.sleep(0)
+
+        finished = max([await asyncio.to_thread(results.get) for _ in processes])
+    finally:
+        await broadcaster.stop()
+        for process in processes:
+            process.join(10)
+
+    elapsed = finished - started
+    return {
+        "elapsed": elapsed,
+        "deliveries_per_second": per_process * client_processes * events / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--shards", default="1,2,4", help="Comma separated shard counts")
+    parser.add_argument("--mode", choices=["process", "thread"], default="process")
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--client-processes", type=int, default=max(1, (os.cpu_count() or 2) // 2))
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPUs, {args.clients} clients, {args.events} events, {args.mode} shards")
+    baseline = None
+    for shards in [int(value) for value in args.shards.split(",")]:
+        result = asyncio.run(measure(shards, args.mode, args.clients, args.events, args.client_processes))
+        baseline = baseline or result["deliveries_per_second"]
+        print(
+            f"{shards:>2} shards: {result['deliveries_per_second']:9.0f} frames/s | "
+            f"{result['elapsed']:.2f} s | x{result['deliveries_per_second'] / baseline:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Event loop / HTTP parser benchmark.
+Compares request throughput and latency of the loop and parser choices
+available to `python -m app.server`.
+
+For each combination, starts a single-worker server and fires
+--requests requests with --concurrency connections at one endpoint.
+
+Usage (from backend/):
+    python -m benchmarks.server_loops --requests 5000 --concurrency 50
+    python -m benchmarks.server_loops --path /questions/
+
+Requires httpx.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+
+COMBINATIONS = [
+    ("asyncio", "h11"),
+    ("asyncio", "httptools"),
+    ("uvloop", "h11"),
+    ("uvloop", "httptools"),
+]
+
+
+def start_server(port: int, loop: str, http: str, db_path: str) -> subprocess.Popen:
+    """Start a single-worker server and wait for readiness."""
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{db_path}",
+        "WEB_CONCURRENCY": "1",
+        "SERVER_PORT": str(port),
+        "SERVER_HOST": "127.0.0.1",
+        "SERVER_LOOP": loop,
+        "SERVER_HTTP": http,
+    }
+    process = subprocess.Popen(
+        [sys.executable, "-m", "app.server"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    for _ in range(300):
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health/ready", timeout=0.5).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.05)
+    process.kill()
+    raise RuntimeError("Server did not start")
+
+
+async def load(port: int, path: str, requests: int, concurrency: int) -> dict:
+    """Send requests over `concurrency` keep-alive connections and time each one."""
+    latencies = []
+    remaining = iter(range(requests))
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits) as client:
+        async def worker():
+            for _ in remaining:
+                started = time.perf_counter()
+                response = await client.get(path)
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*[worker() for _ in range(concurrency)])
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": requests / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--path", default="/health/live")
+    parser.add_argument("--port", type=int, default=8768)
+    args = parser.parse_args()
+
+    for loop, http in COMBINATIONS:
+        with tempfile.TemporaryDirectory() as tmp:
+            server = start_server(args.port, loop, http, os.path.join(tmp, "bench.db"))
+            try:
+                # Warm up connections and code paths before measuring
+                asyncio.run(load(args.port, args.path, args.concurrency * 4, args.concurrency))
+                result = asyncio.run(load(args.port, args.path, args.requests, args.concurrency))
+            finally:
+                server.terminate()
+                server.wait()
+        print(
+            f"{loop:>7} + {http:<9}: {result['rps']:7.0f} req/s | "
+            f"p50 {result['p50_ms']:.1f} ms | p99 {result['p99_ms']:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
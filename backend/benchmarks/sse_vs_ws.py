@@ -0,0 +1,149 @@
+"""
+SSE vs WebSocket benchmark.
+Compares per-connection server memory and broadcast CPU cost of /events and /ws.
+
+Starts the API with uvicorn in a subprocess on a throwaway SQLite database,
+opens N read-only clients of one kind, then posts M questions and waits
+until every client has received every event.
+
+Usage (from backend/):
+    python -m benchmarks.sse_vs_ws --clients 500 --events 200
+
+Linux only (reads /proc for server RSS and CPU time). Requires httpx.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+import websockets
+
+
+def read_rss_kb(pid: int) -> int:
+    """Resident memory of a process in KiB."""
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+def read_cpu_seconds(pid: int) -> float:
+    """User + system CPU time of a process in seconds."""
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def start_server(port: int, db_path: str) -> subprocess.Popen:
+    """Start uvicorn with rate limiting disabled and wait until it answers."""
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{db_path}",
+        "RATE_LIMIT_ENABLED": "false",
+        "WRITE_MAX_CONCURRENCY": "0",
+    }
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env,
+    )
+    for _ in range(100):
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/", timeout=0.5)
+            return process
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("Server did not start")
+
+
+async def sse_client(port: int, expected: int, ready: asyncio.Event, done: list):
+    """Read the SSE stream until `expected` events arrived."""
+    received = 0
+    async with httpx.AsyncClient(timeout=None) as client:
+        async with client.stream("GET", f"http://127.0.0.1:{port}/events") as response:
+            ready.set()
+            async for line in response.aiter_lines():
+                if line.startswith("data:"):
+                    received += 1
+                    if received >= expected:
+                        break
+    done.append(received)
+
+
+async def ws_client(port: int, expected: int, ready: asyncio.Event, done: list):
+    """Read the WebSocket until `expected` events arrived."""
+    received = 0
+    async with websockets.connect(f"ws://127.0.0.1:{port}/ws", max_queue=None) as ws:
+        ready.set()
+        while received < expected:
+            message = json.loads(await ws.recv())
+            if "seq" in message:
+                received += 1
+    done.append(received)
+
+
+async def run(kind: str, port: int, clients: int, events: int, pid: int) -> dict:
+    """Connect clients, publish events and measure the server."""
+    client_fn = sse_client if kind == "sse" else ws_client
+    rss_before = read_rss_kb(pid)
+
+    done: list = []
+    readies = [asyncio.Event() for _ in range(clients)]
+    tasks = [asyncio.create_task(client_fn(port, events, ready, done)) for ready in readies]
+    await asyncio.gather(*[ready.wait() for ready in readies])
+    await asyncio.sleep(0.5)
+    rss_connected = read_rss_kb(pid)
+
+    cpu_before = read_cpu_seconds(pid)
+    started = time.perf_counter()
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}") as client:
+        for i in range(events):
+            await client.post("/questions/", json={"message": f"benchmark question {i}"})
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+    cpu_used = read_cpu_seconds(pid) - cpu_before
+
+    return {
+        "kind": kind,
+        "clients": clients,
+        "events": events,
+        "rss_per_conn_kb": (rss_connected - rss_before) / clients,
+        "cpu_ms_per_delivery": cpu_used * 1000 / (clients * events),
+        "deliveries_per_sec": clients * events / elapsed,
+        "complete": sum(done) == clients * events,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--events", type=int, default=100)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    for kind in ("ws", "sse"):
+        with tempfile.TemporaryDirectory() as tmp:
+            server = start_server(args.port, os.path.join(tmp, "bench.db"))
+            try:
+                result = asyncio.run(run(kind, args.port, args.clients, args.events, server.pid))
+            finally:
+                server.terminate()
+                server.wait()
+        print(
+            f"{result['kind']:>3}: {result['clients']} clients x {result['events']} events | "
+            f"{result['rss_per_conn_kb']:.1f} KiB/conn | "
+            f"{result['cpu_ms_per_delivery'] * 1000:.1f} us CPU/delivery | "
+            f"{result['deliveries_per_sec']:.0f} deliveries/s | "
+            f"complete={result['complete']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+"""
+Gunicorn configuration.
+Same settings as `python -m app.server`, for running gunicorn directly:
+
+    gunicorn -c gunicorn.conf.py app.main:app
+"""
+
+from app.server import gunicorn_options
+
+globals().update(gunicorn_options())
@@ -121,6 +121,14 @@ export default function QuestionList() {
 
   // Handle WebSocket messages for real-time updates (with pagination support)
   const handleWebSocketMessage = useCallback((message: { type: string; data: unknown }) => {
+    // Retention moved a batch of answered questions to the archive
+    if (message.type === "QUESTIONS_ARCHIVED") {
+      const { question_ids } = message.data as { question_ids: number[] };
+      const archived = new Set(question_ids);
+      setQuestions((prev) => prev.filter((q) => !archived.has(q.question_id)));
+      return;
+    }
+
     const questionData = message.data as Partial<Question> & { question_id: number };
     
     // Validate question data has at least question_id
@@ -39,7 +39,7 @@ export interface QuestionPaginatedResponse {
 
 // WebSocket message types
 export interface WebSocketMessage {
-  type: "NEW_QUESTION" | "QUESTION_ANSWERED" | "QUESTION_UPDATED" | "QUESTION_DELETED";
+  type: "NEW_QUESTION" | "QUESTION_ANSWERED" | "QUESTION_UPDATED" | "QUESTION_DELETED" | "QUESTIONS_ARCHIVED";
   data: Record<string, unknown>;
 }
 